@@ -3,7 +3,7 @@ from typing import List, Optional
 from datetime import date
 
 from app.domain.accounts.repositories import AccountRepository
-from app.domain.accounting.entities import JournalEntry
+from app.domain.accounting.entities import JournalEntry, JournalEntryStatus
 
 
 class JournalRepository(ABC):
@@ -13,6 +13,11 @@ class JournalRepository(ABC):
     def add(self, entry: JournalEntry) -> None:
         """Add a new journal entry."""
         pass
+
+    @abstractmethod
+    def add_many(self, entries: List[JournalEntry]) -> None:
+        """Add several journal entries in a single transaction."""
+        pass
     
     @abstractmethod
     def find_by_id(self, entry_id: str) -> Optional[JournalEntry]:
@@ -34,6 +39,14 @@ class JournalRepository(ABC):
         """List journal entries in date range."""
         pass
     
+    @abstractmethod
+    def list_by_account_prefix(
+        self, account_prefix: str, start_date: date, end_date: date, status: JournalEntryStatus
+    ) -> List[JournalEntry]:
+        """List entries in date range with the given status that touch accounts
+        starting with account_prefix. Only those lines are loaded on each entry."""
+        pass
+    
     @abstractmethod
     def get_next_entry_number(self) -> int:
         """Get next available entry number."""
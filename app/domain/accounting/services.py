@@ -101,6 +101,49 @@ class AccountingService:
         self._journal_repo.add(entry)
         return entry
     
+    def create_journal_entries(
+        self,
+        entries: List[Dict]
+    ) -> List[JournalEntry]:
+        """
+        Create several journal entries at once.
+
+        Each item is a dict with entry_date, description, lines and optionally
+        attachment_path (same arguments as create_journal_entry). The next entry
+        number is fetched once and all entries are inserted in one transaction.
+        """
+        next_number = self._journal_repo.get_next_entry_number()
+        known_accounts = set()
+        
+        journal_entries = []
+        for offset, data in enumerate(entries):
+            journal_lines = []
+            for account_code, debit, credit, line_desc in data["lines"]:
+                if account_code not in known_accounts:
+                    if not self._account_repo.find_by_code(account_code):
+                        raise ValueError(f"El compte {account_code} no existeix")
+                    known_accounts.add(account_code)
+                
+                journal_lines.append(JournalLine(
+                    account_code=account_code,
+                    debit=debit,
+                    credit=credit,
+                    description=line_desc
+                ))
+            
+            entry = JournalEntry(
+                entry_number=next_number + offset,
+                entry_date=data["entry_date"],
+                description=data["description"],
+                lines=journal_lines,
+                attachment_path=data.get("attachment_path")
+            )
+            entry.validate()
+            journal_entries.append(entry)
+        
+        self._journal_repo.add_many(journal_entries)
+        return journal_entries
+    
     def post_journal_entry(self, entry_id: str) -> JournalEntry:
         """Post a journal entry (make it permanent)."""
         entry = self._journal_repo.find_by_id(entry_id)
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Iterator, List, Optional, Set
 from .entities import Account
 
 class AccountRepository(ABC):
@@ -10,11 +10,21 @@ class AccountRepository(ABC):
         """Store a new account. Raises if duplicate code."""
         raise NotImplementedError
 
+    @abstractmethod
+    def add_many(self, accounts: List[Account]) -> None:
+        """Store several new accounts in one transaction."""
+        raise NotImplementedError
+
     @abstractmethod
     def list_all(self) -> List[Account]:
         """Return all accounts ordered by code."""
         raise NotImplementedError
 
+    @abstractmethod
+    def iter_all(self) -> Iterator[Account]:
+        """Yield all accounts ordered by code without loading them all at once."""
+        raise NotImplementedError
+
     @abstractmethod
     def list_by_group(self, group: int) -> List[Account]:
         """Return accounts filtered by group."""
@@ -23,4 +33,9 @@ class AccountRepository(ABC):
     @abstractmethod
     def find_by_code(self, code: str) -> Optional[Account]:
         """Return an account by code, or None."""
-        raise NotImplementedError
\ No newline at end of file
+        raise NotImplementedError
+
+    @abstractmethod
+    def list_codes(self) -> Set[str]:
+        """Return the codes of all existing accounts."""
+        raise NotImplementedError
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional
 from .entities import Account, AccountType
 from .repositories import AccountRepository
 
@@ -46,10 +46,44 @@ class AccountService:
         
         self._repository.add(account)
 
+    def import_accounts(self, records: Iterable[Dict]) -> int:
+        """
+        Use case: import a chart of accounts.
+
+        Each record has code, name, type, group and optionally parent_code.
+        Accounts whose code already exists are skipped. Returns the number
+        of accounts created.
+        """
+        existing_codes = self._repository.list_codes()
+
+        new_accounts = []
+        for record in records:
+            code = str(record["code"]).strip()
+            if code in existing_codes:
+                continue
+            account = Account(
+                code=code,
+                name=record["name"].strip(),
+                account_type=AccountType(record["type"]),
+                group=int(record["group"]),
+                parent_code=record.get("parent_code"),
+                is_active=True,
+            )
+            account.validate()
+            new_accounts.append(account)
+            existing_codes.add(code)
+
+        self._repository.add_many(new_accounts)
+        return len(new_accounts)
+
     def list_accounts(self) -> List[Account]:
         """Use case: list all accounts."""
         return self._repository.list_all()
 
+    def iter_accounts(self) -> Iterator[Account]:
+        """Use case: stream all accounts (for very long charts)."""
+        return self._repository.iter_all()
+
     def list_accounts_by_group(self, group: int) -> List[Account]:
         """Use case: list accounts by group."""
         return self._repository.list_by_group(group)
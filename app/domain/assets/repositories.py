@@ -27,3 +27,8 @@ class AssetRepository(ABC):
     def add_depreciation_entry(self, entry: DepreciationEntry) -> DepreciationEntry:
         """Add a depreciation entry to an asset."""
         pass
+
+    @abstractmethod
+    def add_depreciation_entries(self, entries: List[DepreciationEntry]) -> None:
+        """Add several depreciation entries in one batch."""
+        pass
@@ -1,8 +1,11 @@
 from datetime import date
+from decimal import Decimal
 from typing import List
 from app.domain.assets.entities import Asset, DepreciationEntry, AssetStatus, DepreciationMethod
 from app.domain.assets.repositories import AssetRepository
 
+_ZERO = Decimal("0")
+
 class AssetService:
     def __init__(self, asset_repository: AssetRepository, accounting_service):
         self.asset_repository = asset_repository
@@ -34,6 +37,17 @@ class AssetService:
         else:
             raise NotImplementedError("Only LINEAR depreciation is supported")
 
+    def _depreciation_lines(self, asset: Asset, amount: float) -> list:
+        """Journal lines for one depreciation amount, converted to Decimal once."""
+        # Debit: Depreciation Expense (681)
+        # Credit: Accumulated Depreciation (281)
+        value = Decimal(str(amount))
+        description = f"Amortització {asset.name}"
+        return [
+            (asset.account_code_depreciation_expense, value, _ZERO, description),
+            (asset.account_code_accumulated_depreciation, _ZERO, value, description)
+        ]
+
     def generate_depreciation_entries(self, asset_id: int, year: int) -> DepreciationEntry:
         """
         Generate depreciation entry for a specific year.
@@ -59,19 +73,10 @@ class AssetService:
         amount = min(annual_amount, remaining_depreciable)
 
         # Create Journal Entry via AccountingService
-        from decimal import Decimal
-        
-        # Debit: Depreciation Expense (681)
-        # Credit: Accumulated Depreciation (281)
-        lines = [
-            (asset.account_code_depreciation_expense, Decimal(str(amount)), Decimal("0"), f"Amortització {asset.name}"),
-            (asset.account_code_accumulated_depreciation, Decimal("0"), Decimal(str(amount)), f"Amortització {asset.name}")
-        ]
-        
         journal_entry = self.accounting_service.create_journal_entry(
             entry_date=date(year, 12, 31),
             description=f"Amortització {year} - {asset.name}",
-            lines=lines
+            lines=self._depreciation_lines(asset, amount)
         )
 
         entry = DepreciationEntry(
@@ -91,3 +96,59 @@ class AssetService:
             self.asset_repository.save(asset)
             
         return saved_entry
+
+    def generate_all_depreciation_entries(self, asset_id: int) -> List[DepreciationEntry]:
+        """
+        Generate the depreciation entries for every remaining year of the
+        asset's useful life, with their journal entries, in one batch.
+        Years that already have an entry are skipped.
+        """
+        asset = self.get_asset(asset_id)
+
+        if asset.status != AssetStatus.ACTIVE:
+            raise ValueError("Asset is not active")
+
+        annual_amount = self.calculate_annual_depreciation(asset)
+        done_years = {entry.date.year for entry in asset.depreciation_entries}
+        first_year = asset.purchase_date.year
+
+        accumulated = asset.accumulated_depreciation
+        remaining_depreciable = asset.current_value - asset.residual_value
+        schedule = []
+        for year in range(first_year, first_year + asset.useful_life_years):
+            if year in done_years:
+                continue
+            if round(remaining_depreciable, 2) <= 0:
+                break
+            amount = min(annual_amount, remaining_depreciable)
+            remaining_depreciable -= amount
+            accumulated += amount
+            schedule.append((year, amount, accumulated))
+
+        journal_entries = self.accounting_service.create_journal_entries([
+            {
+                "entry_date": date(year, 12, 31),
+                "description": f"Amortització {year} - {asset.name}",
+                "lines": self._depreciation_lines(asset, amount)
+            }
+            for year, amount, _ in schedule
+        ]) if schedule else []
+
+        entries = [
+            DepreciationEntry(
+                asset_id=asset.id,
+                date=date(year, 12, 31),
+                amount=amount,
+                accumulated_depreciation=accumulated_at_year,
+                description=f"Amortització {year} - {asset.name}",
+                journal_entry_id=journal_entry.entry_number
+            )
+            for (year, amount, accumulated_at_year), journal_entry in zip(schedule, journal_entries)
+        ]
+        self.asset_repository.add_depreciation_entries(entries)
+
+        if round(remaining_depreciable, 2) <= 0:
+            asset.status = AssetStatus.FULLY_DEPRECIATED
+            self.asset_repository.save(asset)
+
+        return entries
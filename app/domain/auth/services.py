@@ -30,7 +30,27 @@ LOCKOUT_DURATION_MINUTES = 15
 # Session management
 SESSION_TIMEOUT_HOURS = 24  # Sessions caduquen després de 24h d'inactivitat
 
-pwd_context = CryptContext(schemes=["pbkdf2_sha256", "bcrypt"], deprecated="auto")
+# New hashes use bcrypt; existing pbkdf2_sha256 hashes still verify and are
+# upgraded on the next successful login
+pwd_context = CryptContext(
+    schemes=["bcrypt", "pbkdf2_sha256"],
+    deprecated=["pbkdf2_sha256"],
+    bcrypt__rounds=12
+)
+
+FAST_HASH_FLAG = "--fast-hash"
+
+
+def reset_password_context(argv: List[str]) -> CryptContext:
+    """Password context for the admin-reset scripts.
+
+    Hashes at the production cost unless FAST_HASH_FLAG is passed explicitly,
+    which drops bcrypt to its minimum cost (4 rounds, ~256x faster) for
+    throwaway development databases. Never pass it against production.
+    """
+    if FAST_HASH_FLAG in argv:
+        return pwd_context.copy(bcrypt__rounds=4)
+    return pwd_context
 
 class AuthService:
     def __init__(
@@ -287,10 +307,14 @@ class AuthService:
         user = self._user_repo.get_by_username(username)
         if not user:
             return None
-        if not self.verify_password(password, user.password_hash):
+        valid, new_hash = pwd_context.verify_and_update(password, user.password_hash)
+        if not valid:
             return None
         if not user.is_active:
             return None
+        if new_hash:
+            user.password_hash = new_hash
+            self._user_repo.save(user)
         return user
 
     def create_access_token(self, data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -1,10 +1,72 @@
 from datetime import datetime, date
 from decimal import Decimal
+from functools import lru_cache
 from typing import List, Optional
 import io
 
 from app.domain.banking.entities import BankStatement, BankStatementLine, StatementStatus
 
+# Record type (all records)
+_RECORD_TYPE = slice(0, 2)
+
+# 11: header
+_HDR_BANK = slice(2, 6)
+_HDR_BRANCH = slice(6, 10)
+_HDR_ACCOUNT = slice(10, 20)
+_HDR_START_DATE = slice(20, 26)
+_HDR_END_DATE = slice(26, 32)
+_HDR_SIGN = 32
+_HDR_AMOUNT = slice(33, 47)
+_HDR_CURRENCY = slice(47, 50)
+
+# 22: transaction
+_TXN_DATE = slice(10, 16)
+_TXN_VALUE_DATE = slice(16, 22)
+_TXN_COMMON_CONCEPT = slice(22, 24)
+_TXN_OWN_CONCEPT = slice(24, 27)
+_TXN_SIGN = 27
+_TXN_AMOUNT = slice(28, 42)
+_TXN_DOC_NUMBER = slice(42, 52)
+_TXN_REFERENCE = slice(52, 90)
+
+# 23: extra concept text
+_EXTRA_TEXT = slice(4, 80)
+
+# 33: footer
+_FTR_SIGN = 59
+_FTR_AMOUNT = slice(60, 74)
+
+
+def _decode_amount(amount_str: str, sign: str) -> Decimal:
+    """
+    Decode an amount field: 12 integer digits + 2 decimals.
+    Sign: 1 = Debit (-), 2 = Credit (+). Malformed amounts decode as 0.
+    """
+    try:
+        value = Decimal(amount_str) / 100
+    except ArithmeticError:
+        return Decimal(0)
+    return -value if sign == '1' else value
+
+
+@lru_cache(maxsize=4096)
+def _decode_date(date_str: str) -> Optional[date]:
+    """
+    Decode a YYMMDD field (same century pivot as strptime's %y), or None.
+
+    Statement lines share a handful of dates, so decoded values are cached.
+    """
+    try:
+        if len(date_str) == 6 and date_str.isdigit():
+            year = int(date_str[0:2])
+            year += 2000 if year < 69 else 1900
+            return date(year, int(date_str[2:4]), int(date_str[4:6]))
+        # Unusual padding: let strptime decide
+        return datetime.strptime(date_str, "%y%m%d").date()
+    except ValueError:
+        return None
+
+
 class CSB43Parser:
     """
     Parser for Spanish Norma 43 (CSB43) bank statement files.
@@ -28,7 +90,7 @@ class CSB43Parser:
             if not line_str.strip():
                 continue
                 
-            record_type = line_str[:2]
+            record_type = line_str[_RECORD_TYPE]
             
             if record_type == "11":
                 # Header: New Account Statement
@@ -37,18 +99,18 @@ class CSB43Parser:
                     current_statement.lines = current_lines
                     statements.append(current_statement)
                 
-                bank_code = line_str[2:6]
-                branch_code = line_str[6:10]
-                account_number = line_str[10:20]
-                start_date_str = line_str[20:26]
-                end_date_str = line_str[26:32]
+                bank_code = line_str[_HDR_BANK]
+                branch_code = line_str[_HDR_BRANCH]
+                account_number = line_str[_HDR_ACCOUNT]
+                start_date_str = line_str[_HDR_START_DATE]
+                end_date_str = line_str[_HDR_END_DATE]
                 
                 # Initial Balance
-                sign = line_str[32] # 1=Debit, 2=Credit
-                amount_str = line_str[33:47]
+                sign = line_str[_HDR_SIGN] # 1=Debit, 2=Credit
+                amount_str = line_str[_HDR_AMOUNT]
                 initial_balance = self._parse_amount(amount_str, sign)
                 
-                currency_code = line_str[47:50] # 978 = EUR
+                currency_code = line_str[_HDR_CURRENCY] # 978 = EUR
                 
                 account_id_formatted = f"{bank_code}{branch_code}{account_number}"
                 
@@ -68,14 +130,14 @@ class CSB43Parser:
                 if not current_statement:
                     continue
                     
-                txn_date_str = line_str[10:16]
-                val_date_str = line_str[16:22]
-                common_concept = line_str[22:24]
-                own_concept = line_str[24:27]
-                sign = line_str[27] # 1=Debit, 2=Credit
-                amount_str = line_str[28:42]
-                doc_number = line_str[42:52]
-                reference1 = line_str[52:90].strip()
+                txn_date_str = line_str[_TXN_DATE]
+                val_date_str = line_str[_TXN_VALUE_DATE]
+                common_concept = line_str[_TXN_COMMON_CONCEPT]
+                own_concept = line_str[_TXN_OWN_CONCEPT]
+                sign = line_str[_TXN_SIGN] # 1=Debit, 2=Credit
+                amount_str = line_str[_TXN_AMOUNT]
+                doc_number = line_str[_TXN_DOC_NUMBER]
+                reference1 = line_str[_TXN_REFERENCE].strip()
                 
                 amount = self._parse_amount(amount_str, sign)
                 date_obj = self._parse_date(txn_date_str)
@@ -100,15 +162,15 @@ class CSB43Parser:
             elif record_type == "23":
                 # Extra Info (continues previous 22)
                 if last_line_obj:
-                    extra_text = line_str[4:80].strip()
+                    extra_text = line_str[_EXTRA_TEXT].strip()
                     last_line_obj.concept += " " + extra_text
                     
             elif record_type == "33":
                 # Footer: End of Account
                 if current_statement:
                     # Final Balance Check
-                    sign = line_str[59]
-                    amount_str = line_str[60:74]
+                    sign = line_str[_FTR_SIGN]
+                    amount_str = line_str[_FTR_AMOUNT]
                     final_balance = self._parse_amount(amount_str, sign)
                     
                     # We could verify logic here, but for now just save
@@ -130,19 +192,8 @@ class CSB43Parser:
         return statements
 
     def _parse_amount(self, amount_str: str, sign: str) -> Decimal:
-        # Amount format: 12 digits integer, 2 digits decimal
-        # Sign: 1 = Debit (-), 2 = Credit (+)
-        try:
-            val = Decimal(amount_str) / 100
-            if sign == '1': # Debit
-                return -val
-            return val # Credit
-        except:
-            return Decimal(0)
+        return _decode_amount(amount_str, sign)
 
     def _parse_date(self, date_str: str) -> date:
         # Format YYMMDD
-        try:
-            return datetime.strptime(date_str, "%y%m%d").date()
-        except:
-            return date.today()
+        return _decode_date(date_str) or date.today()
@@ -85,6 +85,7 @@ class FiscalYearService:
 import re
 from decimal import Decimal
 from app.domain.accounting.repositories import JournalRepository
+from app.domain.accounting.entities import JournalEntryStatus
 from app.domain.settings.services import SettingsService
 from app.domain.hr.repositories import PayrollRepository
 from app.domain.fiscal.models import Model303Data, Model111Data
@@ -189,37 +190,20 @@ class FiscalModelService:
 
         # 1. Work (Key A) - From Payrolls
         if self._payroll_repo:
-            current = start_date
-            # Simple month iteration
-            while current <= end_date:
-                # Assuming list_by_period takes month, year
-                payrolls = self._payroll_repo.list_by_period(current.month, current.year)
-                for p in payrolls:
-                    # Skip drafts? Usually yes.
-                    # Handle both Enum and str
-                    status_str = p.status.value if hasattr(p.status, 'value') else str(p.status)
-                    if status_str == "DRAFT":
-                        continue
-                        
-                    model.work_base += p.irpf_base
-                    model.work_quota += p.irpf_amount
-                    model.work_perceptors += 1
-                
-                # Next month
-                if current.month == 12:
-                    current = date(current.year + 1, 1, 1)
-                else:
-                    current = date(current.year, current.month + 1, 1)
+            # Totals of the non-draft payrolls, summed by the database
+            base, quota, count = self._payroll_repo.sum_irpf_between(start_date, end_date)
+            model.work_base += base
+            model.work_quota += quota
+            model.work_perceptors += count
 
         # 2. Professionals (Key G) - From Journal (Acc 4751)
-        # Fetch entries
-        entries = self._journal_repo.list_by_date_range(start_date, end_date)
+        # Fetch only posted entries touching 4751, with just those lines
+        entries = self._journal_repo.list_by_account_prefix(
+            "4751", start_date, end_date, JournalEntryStatus.POSTED
+        )
         processed_entries = set()
 
         for entry in entries:
-            if entry.status.value != "POSTED":
-                continue
-            
             is_payroll = "NOMINA" in entry.description.upper()
             
             for line in entry.lines:
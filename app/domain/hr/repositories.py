@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import date
+from decimal import Decimal
+from typing import List, Optional, Tuple
 from app.domain.hr.entities import Employee
 
 
@@ -69,3 +71,14 @@ class PayrollRepository(ABC):
     def list_by_period(self, month: int, year: int) -> List['Payroll']:
         """List payrolls for a specific month/year."""
         pass
+    
+    @abstractmethod
+    def delete(self, payroll_id: str) -> None:
+        """Delete a payroll."""
+        pass
+    
+    @abstractmethod
+    def sum_irpf_between(self, start_date: date, end_date: date) -> Tuple[Decimal, Decimal, int]:
+        """Return (IRPF base, IRPF amount, payroll count) of the non-draft payrolls
+        for every month from start_date to end_date (inclusive)."""
+        pass
@@ -6,6 +6,9 @@ from app.domain.hr.entities import Employee, Payroll, PayrollStatus
 from app.domain.hr.repositories import EmployeeRepository, PayrollRepository
 # ... imports ...
 
+# Payroll amounts are rounded to cents
+_CENT = Decimal("0.01")
+
 
 class EmployeeService:
     # ... existing code ...
@@ -55,7 +58,7 @@ class PayrollService:
         
         # 3. IRPF
         irpf_rate = employee.irpf_retention
-        irpf_amount = (gross_salary * irpf_rate / 100).quantize(Decimal("0.01"))
+        irpf_amount = (gross_salary * irpf_rate / 100).quantize(_CENT)
         
         # 4. Net
         net_salary = gross_salary - ss_amount_employee - irpf_amount
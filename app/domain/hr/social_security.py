@@ -7,6 +7,10 @@ from typing import Dict, Tuple
 from dataclasses import dataclass
 
 
+# Arrodoniment a cèntims (un sol objecte per a tots els càlculs)
+_CENT = Decimal("0.01")
+
+
 @dataclass
 class SocialSecurityGroup:
     """
@@ -179,10 +183,10 @@ class SocialSecurityCalculator:
         
         breakdown = {
             "base_cotitzacio": base,
-            "contingencies_comunes": (base * group.common_contingencies_company / 100).quantize(Decimal("0.01")),
-            "desocupacio": (base * group.unemployment_company / 100).quantize(Decimal("0.01")),
-            "formacio_professional": (base * group.professional_training_company / 100).quantize(Decimal("0.01")),
-            "fogasa": (base * group.fogasa_company / 100).quantize(Decimal("0.01")),
+            "contingencies_comunes": (base * group.common_contingencies_company / 100).quantize(_CENT),
+            "desocupacio": (base * group.unemployment_company / 100).quantize(_CENT),
+            "formacio_professional": (base * group.professional_training_company / 100).quantize(_CENT),
+            "fogasa": (base * group.fogasa_company / 100).quantize(_CENT),
         }
         
         total = sum(v for k, v in breakdown.items() if k != "base_cotitzacio")
@@ -205,9 +209,9 @@ class SocialSecurityCalculator:
         
         breakdown = {
             "base_cotitzacio": base,
-            "contingencies_comunes": (base * group.common_contingencies_worker / 100).quantize(Decimal("0.01")),
-            "desocupacio": (base * group.unemployment_worker / 100).quantize(Decimal("0.01")),
-            "formacio_professional": (base * group.professional_training_worker / 100).quantize(Decimal("0.01")),
+            "contingencies_comunes": (base * group.common_contingencies_worker / 100).quantize(_CENT),
+            "desocupacio": (base * group.unemployment_worker / 100).quantize(_CENT),
+            "formacio_professional": (base * group.professional_training_worker / 100).quantize(_CENT),
         }
         
         total = sum(v for k, v in breakdown.items() if k != "base_cotitzacio")
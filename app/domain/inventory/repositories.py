@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, List, Optional, Set
 from app.domain.inventory.entities import StockItem, StockMovement
 
 
@@ -26,6 +26,18 @@ class StockItemRepository(ABC):
         """List all stock items."""
         pass
     
+    @abstractmethod
+    def adjust_quantity(self, code: str, delta: int) -> bool:
+        """Add delta to an item's quantity unless the result would be negative.
+        Returns False if the item does not exist or there is not enough stock."""
+        pass
+    
+    @abstractmethod
+    def adjust_quantities(self, deltas: Dict[str, int]) -> Set[str]:
+        """Apply adjust_quantity to several items in one transaction.
+        Returns the codes that were refused (unknown item or not enough stock)."""
+        pass
+    
     @abstractmethod
     def delete(self, item_id: str) -> None:
         """Delete a stock item."""
@@ -40,6 +52,11 @@ class StockMovementRepository(ABC):
         """Save a stock movement."""
         pass
     
+    @abstractmethod
+    def save_many(self, movements: List[StockMovement]) -> None:
+        """Save several stock movements at once."""
+        pass
+    
     @abstractmethod
     def find_by_id(self, movement_id: str) -> Optional[StockMovement]:
         """Find a movement by ID."""
@@ -50,6 +67,11 @@ class StockMovementRepository(ABC):
         """List all movements for a specific item."""
         pass
     
+    @abstractmethod
+    def find_latest_by_item_code(self, item_code: str) -> Optional[StockMovement]:
+        """Find the most recent movement of an item."""
+        pass
+    
     @abstractmethod
     def list_all(self) -> List[StockMovement]:
         """List all movements."""
@@ -1,4 +1,5 @@
-from typing import List, Optional
+from collections import defaultdict
+from typing import List, Optional, Tuple
 from app.domain.inventory.entities import StockItem, StockMovement
 from app.domain.inventory.repositories import StockItemRepository, StockMovementRepository
 
@@ -60,20 +61,51 @@ class InventoryService:
         """Register a stock movement (entrada o sortida)."""
         movement.validate()
         
-        # Verify item exists
-        item = self._item_repo.find_by_code(movement.stock_item_code)
-        if not item:
-            raise ValueError(f"No s'ha trobat l'article amb codi {movement.stock_item_code}")
+        # Update item quantity (refused by the database if stock would go negative)
+        if not self._item_repo.adjust_quantity(movement.stock_item_code, movement.quantity):
+            raise ValueError(self._refusal_reason(movement.stock_item_code, movement.quantity))
         
-        # Update item quantity
-        new_quantity = item.quantity + movement.quantity
-        if new_quantity < 0:
-            raise ValueError(f"Stock insuficient. Disponible: {item.quantity}, Sol·licitat: {abs(movement.quantity)}")
+        return self._movement_repo.save(movement)
+    
+    def register_movements(self, movements: List[StockMovement]) -> List[Tuple[StockMovement, str]]:
+        """
+        Register several stock movements at once.
         
-        item.quantity = new_quantity
-        self._item_repo.save(item)
+        Quantities are adjusted once per item (movements of the same item are
+        accepted or refused together) and the accepted movements are saved in
+        one batch. Returns the refused movements with the reason.
+        """
+        refused: List[Tuple[StockMovement, str]] = []
+        valid: List[StockMovement] = []
+        for movement in movements:
+            try:
+                movement.validate()
+                valid.append(movement)
+            except ValueError as e:
+                refused.append((movement, str(e)))
         
-        return self._movement_repo.save(movement)
+        deltas = defaultdict(int)
+        for movement in valid:
+            deltas[movement.stock_item_code] += movement.quantity
+        refused_codes = self._item_repo.adjust_quantities(dict(deltas))
+        
+        reasons = {code: self._refusal_reason(code, deltas[code]) for code in refused_codes}
+        accepted = []
+        for movement in valid:
+            if movement.stock_item_code in reasons:
+                refused.append((movement, reasons[movement.stock_item_code]))
+            else:
+                accepted.append(movement)
+        
+        self._movement_repo.save_many(accepted)
+        return refused
+    
+    def _refusal_reason(self, item_code: str, quantity: int) -> str:
+        """Explain why a quantity change was refused (only read on the error path)."""
+        item = self._item_repo.find_by_code(item_code)
+        if not item:
+            return f"No s'ha trobat l'article amb codi {item_code}"
+        return f"Stock insuficient. Disponible: {item.quantity}, Sol·licitat: {abs(quantity)}"
     
     def list_movements(self, item_code: Optional[str] = None) -> List[StockMovement]:
         """List movements, optionally filtered by item code."""
@@ -81,6 +113,10 @@ class InventoryService:
             return self._movement_repo.list_by_item_code(item_code)
         return self._movement_repo.list_all()
     
+    def get_last_movement(self, item_code: str) -> Optional[StockMovement]:
+        """Get the most recent movement of an item."""
+        return self._movement_repo.find_latest_by_item_code(item_code)
+    
     def get_stock_level(self, item_code: str) -> int:
         """Get current stock level for an item."""
         item = self._item_repo.find_by_code(item_code)
@@ -16,11 +16,21 @@ class PartnerRepository(ABC):
         """List all partners."""
         pass
     
+    @abstractmethod
+    def find_first_id(self) -> Optional[str]:
+        """Return the ID of the first partner (by name), or None if there are none."""
+        pass
+    
     @abstractmethod
     def find_by_id(self, partner_id: str) -> Optional[Partner]:
         """Find a partner by ID."""
         pass
     
+    @abstractmethod
+    def find_by_ids(self, partner_ids: List[str]) -> List[Partner]:
+        """Find all partners whose ID is in the given list."""
+        pass
+    
     @abstractmethod
     def find_by_tax_id(self, tax_id: str) -> Optional[Partner]:
         """Find a partner by tax ID."""
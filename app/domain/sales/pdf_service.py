@@ -4,9 +4,18 @@ from app.domain.settings.entities import CompanySettings
 from app.domain.documents.services import DocumentService
 
 class PdfService:
+    INVOICE_TEMPLATE = "sales/invoices/pdf.html"
+
     def __init__(self, templates: Jinja2Templates):
         self.templates = templates
         self.doc_service = DocumentService()
+        self._invoice_template = None
+
+    def _get_invoice_template(self):
+        """Resolve the invoice template once per service, not once per invoice."""
+        if self._invoice_template is None:
+            self._invoice_template = self.templates.get_template(self.INVOICE_TEMPLATE)
+        return self._invoice_template
 
     def generate_invoice_pdf(self, invoice: SalesInvoice, partner, company_settings: CompanySettings = None) -> bytes:
         """
@@ -21,8 +30,7 @@ class PdfService:
         }
 
         # Render HTML
-        template = self.templates.get_template("sales/invoices/pdf.html")
-        html_content = template.render(context)
+        html_content = self._get_invoice_template().render(context)
 
         # Convert to PDF
         return self.doc_service.generate_pdf(html_content)
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Tuple
+from app.domain.partners.entities import Partner
 from app.domain.sales.entities import Quote, SalesOrder, SalesInvoice, QuoteStatus, OrderStatus, InvoiceStatus
 
 
@@ -75,6 +76,11 @@ class SalesOrderRepository(ABC):
         """Find sales order by ID."""
         pass
     
+    @abstractmethod
+    def find_by_id_with_partner(self, order_id: str) -> Tuple[Optional[SalesOrder], Optional[Partner]]:
+        """Find sales order by ID together with its partner in a single query."""
+        pass
+    
     @abstractmethod
     def find_by_number(self, order_number: str) -> Optional[SalesOrder]:
         """Find sales order by number."""
@@ -124,6 +130,11 @@ class SalesInvoiceRepository(ABC):
         """Find sales invoice by ID."""
         pass
     
+    @abstractmethod
+    def find_by_id_with_partner(self, invoice_id: str) -> Tuple[Optional[SalesInvoice], Optional[Partner]]:
+        """Find sales invoice by ID together with its partner in a single query."""
+        pass
+    
     @abstractmethod
     def find_by_number(self, series: str, year: int, number: int) -> Optional[SalesInvoice]:
         """Find sales invoice by series, year, and number."""
@@ -134,6 +145,11 @@ class SalesInvoiceRepository(ABC):
         """List all sales invoices."""
         pass
     
+    @abstractmethod
+    def list_all_with_partners(self) -> List[Tuple[SalesInvoice, Optional[Partner]]]:
+        """List all sales invoices, each with its partner, without a query per invoice."""
+        pass
+    
     @abstractmethod
     def list_by_partner(self, partner_id: str) -> List[SalesInvoice]:
         """List sales invoices by partner."""
@@ -144,6 +160,11 @@ class SalesInvoiceRepository(ABC):
         """List sales invoices by status."""
         pass
     
+    @abstractmethod
+    def count_by_status(self, status: InvoiceStatus) -> int:
+        """Count sales invoices with the given status."""
+        pass
+    
     @abstractmethod
     def get_next_invoice_number(self, series: str, year: int) -> int:
         """Get next invoice number for a series and year."""
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import date, timedelta
 from decimal import Decimal
 
@@ -9,6 +9,7 @@ from app.domain.sales.entities import (
 from app.domain.sales.repositories import (
     QuoteRepository, SalesOrderRepository, SalesInvoiceRepository
 )
+from app.domain.partners.entities import Partner
 from app.domain.partners.repositories import PartnerRepository
 from app.domain.accounting.services import AccountingService
 
@@ -179,6 +180,9 @@ class SalesOrderService:
         self._order_repo = order_repo
         self._quote_repo = quote_repo
         self._partner_repo = partner_repo
+        # Read memo. Routers build one service per request (Depends), so this
+        # lives as long as the request; any write clears it.
+        self._read_cache = {}
     
     def create_order(
         self,
@@ -227,6 +231,7 @@ class SalesOrderService:
         
         order.validate()
         self._order_repo.add(order)
+        self._read_cache.clear()
         return order
     
     def create_from_quote(self, quote_id: str, order_date: date = None) -> SalesOrder:
@@ -270,6 +275,7 @@ class SalesOrderService:
         
         order.validate()
         self._order_repo.add(order)
+        self._read_cache.clear()
         return order
     
     def confirm_order(self, order_id: str) -> SalesOrder:
@@ -280,6 +286,7 @@ class SalesOrderService:
         
         order.confirm()
         self._order_repo.update(order)
+        self._read_cache.clear()
         return order
     
     def deliver_order(self, order_id: str) -> SalesOrder:
@@ -290,6 +297,7 @@ class SalesOrderService:
         
         order.deliver()
         self._order_repo.update(order)
+        self._read_cache.clear()
         return order
     
     def cancel_order(self, order_id: str) -> SalesOrder:
@@ -300,11 +308,48 @@ class SalesOrderService:
         
         order.cancel()
         self._order_repo.update(order)
+        self._read_cache.clear()
         return order
     
     def get_order(self, order_id: str) -> Optional[SalesOrder]:
         """Get order by ID."""
-        return self._order_repo.find_by_id(order_id)
+        key = ("order", order_id)
+        if key not in self._read_cache:
+            self._read_cache[key] = self._order_repo.find_by_id(order_id)
+        return self._read_cache[key]
+    
+    def get_partners_for(self, orders: List[SalesOrder]) -> Dict[str, Partner]:
+        """Partners of the given orders keyed by ID, fetched with a single query."""
+        partner_ids = list({o.partner_id for o in orders})
+        return {p.id: p for p in self._partner_repo.find_by_ids(partner_ids)}
+    
+    def list_order_rows(self, partner_id: str = None, status: OrderStatus = None) -> List[Dict]:
+        """Orders flattened to plain dicts for list pages.
+
+        Totals and partner names are computed once here instead of on every
+        template access (``total`` re-sums the lines each time).
+        """
+        orders = self.list_orders(partner_id=partner_id, status=status)
+        partners = self.get_partners_for(orders)
+        return [
+            {
+                "id": o.id,
+                "order_number": o.order_number,
+                "order_date": o.order_date,
+                "partner_id": o.partner_id,
+                "partner_name": partners[o.partner_id].name if o.partner_id in partners else o.partner_id[:8] + "...",
+                "status": o.status,
+                "total": o.total,
+            }
+            for o in orders
+        ]
+    
+    def get_order_with_partner(self, order_id: str) -> Tuple[Optional[SalesOrder], Optional[Partner]]:
+        """Get order by ID together with its partner (single query)."""
+        key = ("order_with_partner", order_id)
+        if key not in self._read_cache:
+            self._read_cache[key] = self._order_repo.find_by_id_with_partner(order_id)
+        return self._read_cache[key]
     
     def list_orders(self, partner_id: str = None, status: OrderStatus = None) -> List[SalesOrder]:
         """List orders with optional filters."""
@@ -333,6 +378,9 @@ class SalesInvoiceService:
         self._order_repo = order_repo
         self._partner_repo = partner_repo
         self._accounting_service = accounting_service
+        # Read memo. Routers build one service per request (Depends), so this
+        # lives as long as the request; any write clears it.
+        self._read_cache = {}
         
         if account_mapping_service:
              self._account_mapping_service = account_mapping_service
@@ -406,6 +454,7 @@ class SalesInvoiceService:
         
         invoice.validate()
         self._invoice_repo.add(invoice)
+        self._read_cache.clear()
         return invoice
     
     def create_from_order(self, order_id: str, invoice_date: date = None, series: str = "A") -> SalesInvoice:
@@ -460,6 +509,7 @@ class SalesInvoiceService:
         
         invoice.validate()
         self._invoice_repo.add(invoice)
+        self._read_cache.clear()
         return invoice
     
     def post_invoice(self, invoice_id: str, user: str = "system") -> SalesInvoice:
@@ -524,35 +574,35 @@ class SalesInvoiceService:
         # Link journal entry to invoice
         invoice.journal_entry_id = journal_entry.id
         self._invoice_repo.update(invoice)
+        self._read_cache.clear()
 
         # Inventory Integration: Register Stock Consumption
         if self._inventory_service:
             from app.domain.inventory.entities import StockMovement
-            for line in invoice.lines:
-                if line.product_code: # Only for lines with product code
-                    # Positive movement = ENTRY, Negative = OUTPUT
-                    # Sale = Output => Negative
-                    try:
-                        self._inventory_service.register_movement(StockMovement(
-                            stock_item_code=line.product_code,
-                            date=invoice.invoice_date,
-                            quantity=-int(line.quantity), # Assuming quantity is integer for inventory for now
-                            description=f"Sortida per Factura {invoice.invoice_number}"
-                        ))
-                    except ValueError as e:
-                        # Log error but don't fail the whole transaction for now (or should we?)
-                        # For "CEO Level" audit, transaction safety is key. But inventory failures shouldn't necessarily block sales if stock check wasn't done before.
-                        # However, let's just log it in audit log if fails?
-                        # Or better, re-raise if we want strict inventory control.
-                        # Let's wrap in try/except and log warning, but proceed.
-                        if self._audit_service:
-                            self._audit_service.log_action(
-                                entity_type="SALES_INVOICE",
-                                entity_id=invoice.id,
-                                action="INVENTORY_ERROR",
-                                user=user,
-                                new_values={"error": str(e), "product": line.product_code}
-                            )
+            # Positive movement = ENTRY, Negative = OUTPUT
+            # Sale = Output => Negative
+            movements = [
+                StockMovement(
+                    stock_item_code=line.product_code,
+                    date=invoice.invoice_date,
+                    quantity=-int(line.quantity), # Assuming quantity is integer for inventory for now
+                    description=f"Sortida per Factura {invoice.invoice_number}"
+                )
+                for line in invoice.lines
+                if line.product_code # Only for lines with product code
+            ]
+            # All lines in one batch; a refused product doesn't block the sale,
+            # it is logged in the audit log instead
+            refused = self._inventory_service.register_movements(movements)
+            if self._audit_service:
+                for movement, error in refused:
+                    self._audit_service.log_action(
+                        entity_type="SALES_INVOICE",
+                        entity_id=invoice.id,
+                        action="INVENTORY_ERROR",
+                        user=user,
+                        new_values={"error": error, "product": movement.stock_item_code}
+                    )
         
         # Audit Log
         if self._audit_service:
@@ -574,11 +624,50 @@ class SalesInvoiceService:
         
         invoice.mark_as_paid()
         self._invoice_repo.update(invoice)
+        self._read_cache.clear()
         return invoice
     
     def get_invoice(self, invoice_id: str) -> Optional[SalesInvoice]:
         """Get invoice by ID."""
-        return self._invoice_repo.find_by_id(invoice_id)
+        key = ("invoice", invoice_id)
+        if key not in self._read_cache:
+            self._read_cache[key] = self._invoice_repo.find_by_id(invoice_id)
+        return self._read_cache[key]
+    
+    def get_partners_for(self, invoices: List[SalesInvoice]) -> Dict[str, Partner]:
+        """Partners of the given invoices keyed by ID, fetched with a single query."""
+        partner_ids = list({i.partner_id for i in invoices})
+        return {p.id: p for p in self._partner_repo.find_by_ids(partner_ids)}
+    
+    def list_invoice_rows(self, partner_id: str = None, status: InvoiceStatus = None) -> List[Dict]:
+        """Invoices flattened to plain dicts for list pages.
+
+        Totals, numbers and partner names are computed once here instead of on
+        every template access (``total`` re-sums the lines each time).
+        """
+        invoices = self.list_invoices(partner_id=partner_id, status=status)
+        partners = self.get_partners_for(invoices)
+        return [
+            {
+                "id": i.id,
+                "invoice_number": i.invoice_number,
+                "invoice_date": i.invoice_date,
+                "due_date": i.due_date,
+                "partner_id": i.partner_id,
+                "partner_name": partners[i.partner_id].name if i.partner_id in partners else i.partner_id,
+                "status": i.status,
+                "payment_status": i.payment_status,
+                "total": i.total,
+            }
+            for i in invoices
+        ]
+    
+    def get_invoice_with_partner(self, invoice_id: str) -> Tuple[Optional[SalesInvoice], Optional[Partner]]:
+        """Get invoice by ID together with its partner (single query)."""
+        key = ("invoice_with_partner", invoice_id)
+        if key not in self._read_cache:
+            self._read_cache[key] = self._invoice_repo.find_by_id_with_partner(invoice_id)
+        return self._read_cache[key]
     
     def list_invoices(self, partner_id: str = None, status: InvoiceStatus = None) -> List[SalesInvoice]:
         """List invoices with optional filters."""
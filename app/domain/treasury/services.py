@@ -1,7 +1,8 @@
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from datetime import date, timedelta
 from decimal import Decimal
 import logging
+import time
 
 from app.domain.treasury.entities import BankAccount
 from app.infrastructure.persistence.treasury.repository import SqlAlchemyTreasuryRepository
@@ -10,6 +11,17 @@ from app.domain.sales.entities import InvoiceStatus
 
 logger = logging.getLogger(__name__)
 
+# The forecast aggregates every invoice plus payroll, and services are built per
+# request, so keep recent results at module level keyed by horizon (days).
+FORECAST_CACHE_TTL_SECONDS = 60
+FORECAST_CACHE_MAX_ENTRIES = 16
+_forecast_cache: Dict[int, Tuple[float, Dict]] = {}
+
+
+def invalidate_cash_flow_forecast() -> None:
+    """Drop cached forecasts; call after anything that changes receivables."""
+    _forecast_cache.clear()
+
 
 class TreasuryService:
     """Treasury and Cash Flow management service."""
@@ -33,6 +45,9 @@ class TreasuryService:
 
     def list_bank_accounts(self) -> List[BankAccount]:
         return self.treasury_repo.list_all()
+
+    def bank_account_exists(self, iban: str) -> bool:
+        return self.treasury_repo.exists_by_iban(iban)
     
     def get_current_cash_balance(self) -> Decimal:
         """Get current cash from accounting (accounts 57x)."""
@@ -50,20 +65,24 @@ class TreasuryService:
         return total
     
     def get_receivables_schedule(self, days_ahead: int = 90) -> List[Dict]:
-        """Get receivables schedule for forecasting."""
+        """Get receivables schedule for forecasting.
+
+        Every POSTED invoice counts for its full total: paid invoices move to
+        PAID, but SalesInvoice records no amount paid, so an invoice with
+        PaymentStatus.PARTIAL is still counted in full and the inflow is
+        overstated by whatever has already been collected on it.
+        """
         if not self.sales_invoice_repo:
             return []
         
-        invoices = self.sales_invoice_repo.list_all()
+        # Only posted invoices are pending collection; filter in SQL
+        invoices = self.sales_invoice_repo.list_by_status(InvoiceStatus.POSTED)
         receivables = []
         today = date.today()
         cutoff = today + timedelta(days=days_ahead)
         
         for invoice in invoices:
-            if invoice.status != InvoiceStatus.POSTED:
-                continue
-            
-            pending = invoice.total_amount - (invoice.amount_paid or Decimal(0))
+            pending = invoice.total
             
             if pending <= 0:
                 continue
@@ -102,7 +121,19 @@ class TreasuryService:
         return expenses
 
     def get_cash_flow_forecast(self, days: int = 90) -> Dict:
-        """Calculate comprehensive cash flow forecast."""
+        """Calculate comprehensive cash flow forecast (cached for a short TTL)."""
+        now = time.monotonic()
+        cached = _forecast_cache.get(days)
+        if cached and now - cached[0] < FORECAST_CACHE_TTL_SECONDS:
+            return cached[1]
+        
+        forecast = self._build_cash_flow_forecast(days)
+        if len(_forecast_cache) >= FORECAST_CACHE_MAX_ENTRIES:
+            _forecast_cache.clear()
+        _forecast_cache[days] = (now, forecast)
+        return forecast
+
+    def _build_cash_flow_forecast(self, days: int) -> Dict:
         today = date.today()
         current_cash = float(self.get_current_cash_balance())
         receivables = self.get_receivables_schedule(days)
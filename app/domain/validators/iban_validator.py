@@ -20,6 +20,12 @@ class IBANValidator:
         # Afegir més països si cal
     }
     
+    # Format bàsic: 2 lletres + 2 dígits + caràcters alfanumèrics
+    IBAN_PATTERN = re.compile(r'^[A-Z]{2}\d{2}[A-Z0-9]+$')
+    
+    # Lletres a números per al mòdul 97 (A=10, B=11, ..., Z=35)
+    LETTER_VALUES = str.maketrans({chr(c): str(c - ord('A') + 10) for c in range(ord('A'), ord('Z') + 1)})
+    
     @staticmethod
     def validate_iban(iban: str) -> bool:
         """
@@ -32,7 +38,7 @@ class IBANValidator:
         iban = iban.upper().strip().replace(" ", "").replace("-", "")
         
         # Comprovar format bàsic: 2 lletres + 2 dígits + fins a 30 caràcters alfanumèrics
-        if not re.match(r'^[A-Z]{2}\d{2}[A-Z0-9]+$', iban):
+        if not IBANValidator.IBAN_PATTERN.match(iban):
             return False
         
         # Comprovar longitud segons país
@@ -50,12 +56,7 @@ class IBANValidator:
         rearranged = iban[4:] + iban[:4]
         
         # Convertir lletres a números (A=10, B=11, ..., Z=35)
-        numeric_iban = ""
-        for char in rearranged:
-            if char.isdigit():
-                numeric_iban += char
-            else:
-                numeric_iban += str(ord(char) - ord('A') + 10)
+        numeric_iban = rearranged.translate(IBANValidator.LETTER_VALUES)
         
         # Calcular mòdul 97
         return int(numeric_iban) % 97 == 1
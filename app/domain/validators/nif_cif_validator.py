@@ -16,6 +16,11 @@ class DocumentValidator:
     # Tipus d'organització per CIF
     CIF_ORG_TYPES = "ABCDEFGHJNPQRSUVW"
     
+    # Formats (compilats una sola vegada)
+    NIF_PATTERN = re.compile(r'^\d{8}[A-Z]$')
+    NIE_PATTERN = re.compile(r'^[XYZ]\d{7}[A-Z]$')
+    CIF_PATTERN = re.compile(r'^[A-Z]\d{7}[A-Z0-9]$')
+    
     @staticmethod
     def validate_nif(nif: str) -> bool:
         """
@@ -28,7 +33,7 @@ class DocumentValidator:
         nif = nif.upper().strip().replace("-", "").replace(" ", "")
         
         # Comprovar format: 8 dígits + 1 lletra
-        if not re.match(r'^\d{8}[A-Z]$', nif):
+        if not DocumentValidator.NIF_PATTERN.match(nif):
             return False
         
         # Extreure número i lletra
@@ -52,7 +57,7 @@ class DocumentValidator:
         nie = nie.upper().strip().replace("-", "").replace(" ", "")
         
         # Comprovar format: X/Y/Z + 7 dígits + lletra
-        if not re.match(r'^[XYZ]\d{7}[A-Z]$', nie):
+        if not DocumentValidator.NIE_PATTERN.match(nie):
             return False
         
         # Convertir primera lletra a número (X=0, Y=1, Z=2)
@@ -78,7 +83,7 @@ class DocumentValidator:
         cif = cif.upper().strip().replace("-", "").replace(" ", "")
         
         # Comprovar format: lletra + 7 dígits + dígit/lletra
-        if not re.match(r'^[A-Z]\d{7}[A-Z0-9]$', cif):
+        if not DocumentValidator.CIF_PATTERN.match(cif):
             return False
         
         # Comprovar que la primera lletra sigui vàlida
@@ -7,6 +7,9 @@ import re
 class NSSValidator:
     """Validador de NSS segons normativa de la Seguretat Social espanyola."""
     
+    # Format: exactament 12 dígits
+    NSS_PATTERN = re.compile(r'^\d{12}$')
+    
     @staticmethod
     def validate_nss(nss: str) -> bool:
         """
@@ -20,7 +23,7 @@ class NSSValidator:
         nss = nss.strip().replace(" ", "").replace("-", "").replace("/", "")
         
         # Comprovar que siguin exactament 12 dígits
-        if not re.match(r'^\d{12}$', nss):
+        if not NSSValidator.NSS_PATTERN.match(nss):
             return False
         
         # Extreure parts
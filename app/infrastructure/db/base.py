@@ -1,4 +1,4 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, inspect
 from sqlalchemy.orm import sessionmaker, DeclarativeBase, Session
 from app.config import DATABASE_URL  # el tens a l'arrel
 
@@ -10,15 +10,26 @@ engine = create_engine(
     DATABASE_URL,
     echo=True,     # posa False si no vols veure els SQL per pantalla
     future=True,
+    pool_size=10,
+    max_overflow=20,
+    pool_use_lifo=True,   # reutilitza primer la connexió més recent (la més "calenta")
+    pool_pre_ping=True,   # descarta connexions que MySQL ha tancat per inactivitat
 )
 
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, class_=Session)
 
 
+_initialized = False
+
+
 def init_db():
     """
     Crea totes les taules definides a models que hereten de Base.
+    Només fa la feina la primera vegada en cada procés.
     """
+    global _initialized
+    if _initialized:
+        return
     # importa els models perquè quedin registrats a Base.metadata
     from app.infrastructure.persistence.accounts.models import AccountModel  # noqa: F401
     from app.infrastructure.persistence.partners.models import PartnerModel  # noqa: F401
@@ -33,8 +44,19 @@ def init_db():
     from app.infrastructure.persistence.auth.repositories import UserModel  # noqa: F401
     from app.infrastructure.persistence.fiscal.models import FiscalYearModel  # noqa: F401
     from app.infrastructure.persistence.treasury.models import BankAccountModel  # noqa: F401
+    from app.infrastructure.persistence.banking.models import BankStatementModel, BankStatementLineModel  # noqa: F401
+    from app.infrastructure.persistence.budgets.models import BudgetModel, BudgetLineModel  # noqa: F401
+    from app.infrastructure.persistence.finance.models import LoanModel, AmortizationEntryModel  # noqa: F401
+    from app.infrastructure.persistence.settings.models import CompanySettingsModel  # noqa: F401
 
-    Base.metadata.create_all(bind=engine)
+    # Una sola consulta per llistar les taules existents; amb la base de dades
+    # ja creada no cal comprovar taula per taula ni executar cap CREATE
+    with engine.begin() as conn:
+        existing = set(inspect(conn).get_table_names())
+        missing = [t for t in Base.metadata.sorted_tables if t.name not in existing]
+        if missing:
+            Base.metadata.create_all(bind=conn, tables=missing, checkfirst=True)
+    _initialized = True
 
 
 def get_db():
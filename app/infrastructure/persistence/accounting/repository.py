@@ -1,7 +1,7 @@
 from typing import List, Optional
 from datetime import date
-from sqlalchemy import select, func
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import select, func, insert
+from sqlalchemy.orm import Session, joinedload, contains_eager
 
 from app.domain.accounting.entities import (
     JournalEntry, JournalLine, JournalEntryStatus
@@ -49,6 +49,41 @@ class SqlAlchemyJournalRepository(JournalRepository):
         finally:
             session.close()
 
+    def add_many(self, entries: List[JournalEntry]) -> None:
+        if not entries:
+            return
+        session: Session = self._session_factory()
+        try:
+            # Multi-row INSERTs: one for the entries, one for all their lines
+            session.execute(insert(JournalEntryModel), [
+                {
+                    "id": entry.id,
+                    "entry_number": entry.entry_number,
+                    "entry_date": entry.entry_date,
+                    "description": entry.description,
+                    "status": entry.status,
+                    "attachment_path": entry.attachment_path
+                }
+                for entry in entries
+            ])
+            line_rows = [
+                {
+                    "id": line.id,
+                    "journal_entry_id": entry.id,
+                    "account_code": line.account_code,
+                    "debit": line.debit,
+                    "credit": line.credit,
+                    "description": line.description
+                }
+                for entry in entries
+                for line in entry.lines
+            ]
+            if line_rows:
+                session.execute(insert(JournalLineModel), line_rows)
+            session.commit()
+        finally:
+            session.close()
+
     def find_by_id(self, entry_id: str) -> Optional[JournalEntry]:
         session: Session = self._session_factory()
         try:
@@ -104,6 +139,26 @@ class SqlAlchemyJournalRepository(JournalRepository):
         finally:
             session.close()
 
+    def list_by_account_prefix(
+        self, account_prefix: str, start_date: date, end_date: date, status: JournalEntryStatus
+    ) -> List[JournalEntry]:
+        session: Session = self._session_factory()
+        try:
+            # Join instead of joinedload so the matching lines fill the collection
+            stmt = select(JournalEntryModel).join(JournalEntryModel.lines).options(
+                contains_eager(JournalEntryModel.lines)
+            ).where(
+                JournalLineModel.account_code.startswith(account_prefix),
+                JournalEntryModel.entry_date >= start_date,
+                JournalEntryModel.entry_date <= end_date,
+                JournalEntryModel.status == status
+            ).order_by(JournalEntryModel.entry_date, JournalEntryModel.entry_number)
+            result = session.execute(stmt)
+            models: List[JournalEntryModel] = result.scalars().unique().all()
+            return [self._model_to_entity(m) for m in models]
+        finally:
+            session.close()
+
     def get_next_entry_number(self) -> int:
         session: Session = self._session_factory()
         try:
@@ -1,6 +1,6 @@
-from typing import List, Optional
+from typing import Iterator, List, Optional, Set
 
-from sqlalchemy import select
+from sqlalchemy import select, insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
@@ -36,6 +36,33 @@ class SqlAlchemyAccountRepository(AccountRepository):
         finally:
             session.close()
 
+    def add_many(self, accounts: List[Account], chunk_size: int = 500) -> None:
+        if not accounts:
+            return
+        session: Session = self._session_factory()
+        try:
+            rows = [
+                {
+                    "id": account.id,
+                    "code": account.code,
+                    "name": account.name,
+                    "account_type": account.account_type,
+                    "group": account.group,
+                    "is_active": account.is_active,
+                    "parent_code": account.parent_code
+                }
+                for account in accounts
+            ]
+            # Multi-row INSERTs in chunks so a full chart is a handful of round trips
+            for start in range(0, len(rows), chunk_size):
+                session.execute(insert(AccountModel), rows[start:start + chunk_size])
+            session.commit()
+        except IntegrityError:
+            session.rollback()
+            raise ValueError("Some of the accounts already exist.")
+        finally:
+            session.close()
+
     def list_all(self) -> List[Account]:
         session: Session = self._session_factory()
         try:
@@ -46,6 +73,17 @@ class SqlAlchemyAccountRepository(AccountRepository):
         finally:
             session.close()
 
+    def iter_all(self, batch_size: int = 500) -> Iterator[Account]:
+        session: Session = self._session_factory()
+        try:
+            # yield_per streams rows from the cursor in batches instead of
+            # buffering the whole chart of accounts
+            stmt = select(AccountModel).order_by(AccountModel.code).execution_options(yield_per=batch_size)
+            for model in session.execute(stmt).scalars():
+                yield self._model_to_entity(model)
+        finally:
+            session.close()
+
     def list_by_group(self, group: int) -> List[Account]:
         session: Session = self._session_factory()
         try:
@@ -71,6 +109,13 @@ class SqlAlchemyAccountRepository(AccountRepository):
         finally:
             session.close()
 
+    def list_codes(self) -> Set[str]:
+        session: Session = self._session_factory()
+        try:
+            return set(session.execute(select(AccountModel.code)).scalars())
+        finally:
+            session.close()
+
     def _model_to_entity(self, model: AccountModel) -> Account:
         return Account(
             id=model.id,
@@ -1,5 +1,6 @@
 from typing import List, Optional
-from sqlalchemy.orm import Session
+from sqlalchemy import insert
+from sqlalchemy.orm import Session, selectinload
 from app.domain.assets.entities import Asset, DepreciationEntry
 from app.domain.assets.repositories import AssetRepository
 from app.infrastructure.persistence.assets.models import AssetModel, DepreciationEntryModel
@@ -8,6 +9,10 @@ class SqlAlchemyAssetRepository(AssetRepository):
     def __init__(self, db: Session):
         self.db = db
 
+    def _query(self):
+        """Assets with their depreciation entries loaded in one extra SELECT ... IN."""
+        return self.db.query(AssetModel).options(selectinload(AssetModel.depreciation_entries))
+
     def _to_entity(self, model: AssetModel) -> Asset:
         if not model:
             return None
@@ -79,15 +84,15 @@ class SqlAlchemyAssetRepository(AssetRepository):
         return self._to_entity(model)
 
     def get_by_id(self, asset_id: int) -> Optional[Asset]:
-        model = self.db.query(AssetModel).filter(AssetModel.id == asset_id).first()
+        model = self._query().filter(AssetModel.id == asset_id).first()
         return self._to_entity(model)
 
     def get_by_code(self, code: str) -> Optional[Asset]:
-        model = self.db.query(AssetModel).filter(AssetModel.code == code).first()
+        model = self._query().filter(AssetModel.code == code).first()
         return self._to_entity(model)
 
     def list_all(self) -> List[Asset]:
-        models = self.db.query(AssetModel).all()
+        models = self._query().all()
         return [self._to_entity(m) for m in models]
 
     def add_depreciation_entry(self, entry: DepreciationEntry) -> DepreciationEntry:
@@ -105,3 +110,20 @@ class SqlAlchemyAssetRepository(AssetRepository):
         
         entry.id = model.id
         return entry
+
+    def add_depreciation_entries(self, entries: List[DepreciationEntry]) -> None:
+        if not entries:
+            return
+        # One multi-row INSERT for the whole schedule
+        self.db.execute(insert(DepreciationEntryModel), [
+            {
+                "asset_id": entry.asset_id,
+                "date": entry.date,
+                "amount": entry.amount,
+                "accumulated_depreciation": entry.accumulated_depreciation,
+                "description": entry.description,
+                "journal_entry_id": entry.journal_entry_id
+            }
+            for entry in entries
+        ])
+        self.db.commit()
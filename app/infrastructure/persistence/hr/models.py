@@ -1,4 +1,4 @@
-from sqlalchemy import String, Boolean, Integer, Date, Numeric
+from sqlalchemy import String, Boolean, Integer, Date, Numeric, Index
 from sqlalchemy.orm import Mapped, mapped_column
 from datetime import date
 from decimal import Decimal
@@ -52,6 +52,10 @@ class EmployeeModel(Base):
 class PayrollModel(Base):
     """SQLAlchemy model for payrolls table."""
     __tablename__ = "payrolls"
+    __table_args__ = (
+        # Period lookups (list_by_period, Model 111 quarters)
+        Index("ix_payrolls_year_month", "year", "month"),
+    )
     
     id: Mapped[str] = mapped_column(String(36), primary_key=True)
     employee_id: Mapped[str] = mapped_column(String(36), index=True)
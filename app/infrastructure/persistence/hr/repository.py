@@ -1,12 +1,12 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from datetime import date
 from decimal import Decimal
 
-from sqlalchemy import select
+from sqlalchemy import select, func
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from app.domain.hr.entities import Employee, Payroll
+from app.domain.hr.entities import Employee, Payroll, PayrollStatus
 from app.domain.hr.repositories import EmployeeRepository, PayrollRepository
 from app.infrastructure.persistence.hr.models import EmployeeModel, PayrollModel
 from app.infrastructure.db.base import SessionLocal
@@ -279,6 +279,44 @@ class SqlAlchemyPayrollRepository(PayrollRepository):
         finally:
             session.close()
 
+    def delete(self, payroll_id: str) -> None:
+        session: Session = self._session_factory()
+        try:
+            stmt = select(PayrollModel).where(PayrollModel.id == payroll_id)
+            result = session.execute(stmt)
+            model: PayrollModel | None = result.scalars().first()
+            
+            if not model:
+                raise ValueError(f"No s'ha trobat la nòmina amb ID {payroll_id}")
+            
+            session.delete(model)
+            session.commit()
+        finally:
+            session.close()
+
+    def sum_irpf_between(self, start_date: date, end_date: date) -> Tuple[Decimal, Decimal, int]:
+        session: Session = self._session_factory()
+        try:
+            # Months as a single ordinal so a quarter (or a year) is one query
+            period = PayrollModel.year * 12 + PayrollModel.month
+            stmt = select(
+                func.coalesce(func.sum(PayrollModel.irpf_base), 0),
+                func.coalesce(func.sum(PayrollModel.irpf_amount), 0),
+                func.count(PayrollModel.id)
+            ).where(
+                # The year range lets the (year, month) index narrow the scan
+                PayrollModel.year.between(start_date.year, end_date.year),
+                period.between(
+                    start_date.year * 12 + start_date.month,
+                    end_date.year * 12 + end_date.month
+                ),
+                PayrollModel.status != PayrollStatus.DRAFT.value
+            )
+            base, amount, count = session.execute(stmt).one()
+            return Decimal(base), Decimal(amount), count
+        finally:
+            session.close()
+
     def _model_to_entity(self, model: PayrollModel) -> Payroll:
         return Payroll(
             id=model.id,
@@ -1,10 +1,13 @@
-from sqlalchemy import Column, String, Float, Integer, Boolean, Date, ForeignKey
+from sqlalchemy import Column, String, Float, Integer, Boolean, Date, ForeignKey, CheckConstraint, Index
 from sqlalchemy.orm import relationship
 from app.infrastructure.db.base import Base
 
 
 class StockItemModel(Base):
     __tablename__ = "stock_items"
+    __table_args__ = (
+        CheckConstraint("quantity >= 0", name="ck_stock_items_quantity_non_negative"),
+    )
     
     id = Column(String(36), primary_key=True, index=True)
     code = Column(String(50), unique=True, index=True, nullable=False)
@@ -20,6 +23,10 @@ class StockItemModel(Base):
 
 class StockMovementModel(Base):
     __tablename__ = "stock_movements"
+    __table_args__ = (
+        # An item's movements, newest first
+        Index("ix_stock_movements_item_date", "stock_item_code", "date"),
+    )
     
     id = Column(String(36), primary_key=True, index=True)
     stock_item_code = Column(String(50), ForeignKey("stock_items.code"), nullable=False)
@@ -1,6 +1,6 @@
-from typing import List, Optional
+from typing import Dict, List, Optional, Set
 from sqlalchemy.orm import Session
-from sqlalchemy import select
+from sqlalchemy import select, update, insert
 
 from app.domain.inventory.entities import StockItem, StockMovement
 from app.domain.inventory.repositories import StockItemRepository, StockMovementRepository
@@ -73,6 +73,38 @@ class SqlAlchemyStockItemRepository(StockItemRepository):
         finally:
             session.close()
     
+    def adjust_quantity(self, code: str, delta: int) -> bool:
+        session: Session = self._session_factory()
+        try:
+            # Check and update in one statement, so concurrent movements can't oversell
+            stmt = update(StockItemModel).where(
+                StockItemModel.code == code,
+                StockItemModel.quantity + delta >= 0
+            ).values(quantity=StockItemModel.quantity + delta)
+            result = session.execute(stmt)
+            session.commit()
+            return result.rowcount == 1
+        finally:
+            session.close()
+    
+    def adjust_quantities(self, deltas: Dict[str, int]) -> Set[str]:
+        if not deltas:
+            return set()
+        session: Session = self._session_factory()
+        try:
+            refused = set()
+            for code, delta in deltas.items():
+                stmt = update(StockItemModel).where(
+                    StockItemModel.code == code,
+                    StockItemModel.quantity + delta >= 0
+                ).values(quantity=StockItemModel.quantity + delta)
+                if session.execute(stmt).rowcount != 1:
+                    refused.add(code)
+            session.commit()
+            return refused
+        finally:
+            session.close()
+    
     def list_all(self) -> List[StockItem]:
         session: Session = self._session_factory()
         try:
@@ -125,6 +157,26 @@ class SqlAlchemyStockMovementRepository(StockMovementRepository):
         finally:
             session.close()
     
+    def save_many(self, movements: List[StockMovement]) -> None:
+        if not movements:
+            return
+        session: Session = self._session_factory()
+        try:
+            # One executemany INSERT instead of a flush per movement
+            session.execute(insert(StockMovementModel), [
+                {
+                    "id": movement.id,
+                    "stock_item_code": movement.stock_item_code,
+                    "date": movement.date,
+                    "quantity": movement.quantity,
+                    "description": movement.description
+                }
+                for movement in movements
+            ])
+            session.commit()
+        finally:
+            session.close()
+    
     def find_by_id(self, movement_id: str) -> Optional[StockMovement]:
         session: Session = self._session_factory()
         try:
@@ -143,6 +195,16 @@ class SqlAlchemyStockMovementRepository(StockMovementRepository):
         finally:
             session.close()
     
+    def find_latest_by_item_code(self, item_code: str) -> Optional[StockMovement]:
+        session: Session = self._session_factory()
+        try:
+            model = session.query(StockMovementModel).filter(
+                StockMovementModel.stock_item_code == item_code
+            ).order_by(StockMovementModel.date.desc()).first()  # LIMIT 1
+            return self._to_entity(model)
+        finally:
+            session.close()
+    
     def list_all(self) -> List[StockMovement]:
         session: Session = self._session_factory()
         try:
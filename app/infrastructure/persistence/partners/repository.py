@@ -38,6 +38,15 @@ class SqlAlchemyPartnerRepository(PartnerRepository):
         finally:
             session.close()
 
+    def find_first_id(self) -> Optional[str]:
+        session: Session = self._session_factory()
+        try:
+            # Only the id column: no rows to hydrate into entities
+            stmt = select(PartnerModel.id).order_by(PartnerModel.name).limit(1)
+            return session.execute(stmt).scalar()
+        finally:
+            session.close()
+
     def find_by_id(self, partner_id: str) -> Optional[Partner]:
         session: Session = self._session_factory()
         try:
@@ -50,6 +59,18 @@ class SqlAlchemyPartnerRepository(PartnerRepository):
         finally:
             session.close()
 
+    def find_by_ids(self, partner_ids: List[str]) -> List[Partner]:
+        if not partner_ids:
+            return []
+        session: Session = self._session_factory()
+        try:
+            stmt = select(PartnerModel).where(PartnerModel.id.in_(set(partner_ids)))
+            result = session.execute(stmt)
+            models: List[PartnerModel] = result.scalars().all()
+            return [self._model_to_entity(m) for m in models]
+        finally:
+            session.close()
+
     def find_by_tax_id(self, tax_id: str) -> Optional[Partner]:
         session: Session = self._session_factory()
         try:
@@ -3,6 +3,7 @@ from sqlalchemy.orm import relationship
 from datetime import date
 
 from app.infrastructure.db.base import Base
+from app.infrastructure.persistence.partners.models import PartnerModel
 from app.domain.sales.entities import QuoteStatus, OrderStatus, InvoiceStatus, PaymentStatus
 
 
@@ -56,6 +57,12 @@ class SalesOrderModel(Base):
     
     # Relationships
     lines = relationship("SalesLineModel", foreign_keys=[SalesLineModel.order_id], cascade="all, delete-orphan")
+    # partner_id has no FK constraint, so the join condition is declared explicitly
+    partner = relationship(
+        PartnerModel,
+        primaryjoin="foreign(SalesOrderModel.partner_id) == PartnerModel.id",
+        viewonly=True
+    )
 
 
 class SalesInvoiceModel(Base):
@@ -77,3 +84,9 @@ class SalesInvoiceModel(Base):
     
     # Relationships
     lines = relationship("SalesLineModel", foreign_keys=[SalesLineModel.invoice_id], cascade="all, delete-orphan")
+    # partner_id has no FK constraint, so the join condition is declared explicitly
+    partner = relationship(
+        PartnerModel,
+        primaryjoin="foreign(SalesInvoiceModel.partner_id) == PartnerModel.id",
+        viewonly=True
+    )
@@ -16,15 +16,17 @@ class SqlAlchemyCompanySettingsRepository:
 
     def save(self, settings: CompanySettings) -> None:
         with self.session_factory() as session:
-            # Check if exists (singleton)
-            existing = session.query(CompanySettingsModel).first()
-            if existing:
-                # Update ID to match existing to ensure update happens on same row
-                settings.id = existing.id 
-                model = self._to_model(settings)
-                session.merge(model)
-            else:
-                model = self._to_model(settings)
+            model = self._to_model(settings)
+            # Singleton row: update it in place with a single UPDATE, no SELECT
+            # first. Unset fields (e.g. logo_url when no new logo was uploaded)
+            # are left out so the stored values are kept.
+            values = {
+                column.name: getattr(model, column.name)
+                for column in CompanySettingsModel.__table__.columns
+                if column.name != "id" and getattr(model, column.name) is not None
+            }
+            updated = session.query(CompanySettingsModel).update(values, synchronize_session=False)
+            if not updated:
                 session.add(model)
             session.commit()
 
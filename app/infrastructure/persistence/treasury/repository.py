@@ -26,6 +26,10 @@ class SqlAlchemyTreasuryRepository:
             models = session.query(BankAccountModel).all()
             return [self._to_entity(m) for m in models]
 
+    def exists_by_iban(self, iban: str) -> bool:
+        with self.session_factory() as session:
+            return session.query(BankAccountModel.id).filter_by(iban=iban).first() is not None
+
     def get_by_id(self, id: str) -> Optional[BankAccount]:
         with self.session_factory() as session:
             model = session.query(BankAccountModel).get(id)
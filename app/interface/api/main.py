@@ -1,6 +1,5 @@
 from fastapi import FastAPI, Request, Depends
 from fastapi.staticfiles import StaticFiles
-from fastapi.templating import Jinja2Templates
 from fastapi.responses import HTMLResponse, RedirectResponse
 from typing import Optional
 import os
@@ -8,7 +7,9 @@ import os
 from app.interface.api.routers import partners, accounting, accounts, quotes, sales_orders, sales_invoices, auth, assets, inventory, fiscal, analytics, treasury, budgets, finance, banking, ai, hr, purchases
 from app.domain.auth.dependencies import get_current_user_or_redirect, can_access_module
 from app.domain.auth.entities import User
-from app.interface.api.templates import templates
+from app.domain.analytics.dashboard_service import DashboardService
+from app.infrastructure.db.base import SessionLocal
+from app.interface.api.templates import templates, precompile_templates
 
 # Initialize App
 app = FastAPI(title="ContaCAT", description="ERP Modular amb DDD", version="2.0.0")
@@ -44,6 +45,12 @@ app.include_router(settings.router)
 app.include_router(purchases.router)
 
 
+@app.on_event("startup")
+def warm_template_cache():
+    """Compile all templates once per worker at startup."""
+    precompile_templates()
+
+
 @app.get("/", response_class=HTMLResponse)
 async def home(
     request: Request,
@@ -93,9 +100,6 @@ async def home(
             grouped_modules[cat].append(module)
             
     # Dashboard Data
-    from app.domain.analytics.dashboard_service import DashboardService
-    from app.infrastructure.db.base import SessionLocal
-    
     dashboard_service = DashboardService(SessionLocal)
     kpis = dashboard_service.get_kpis()
     trend = dashboard_service.get_sales_trend()
@@ -0,0 +1,10 @@
+from fastapi import Response
+
+
+def redirect(url: str, status_code: int = 303) -> Response:
+    """Bare redirect (Post/Redirect/Get): empty body, only the Location header.
+
+    Cheaper than RedirectResponse, which URL-quotes the target and goes through
+    the generic body/charset handling for an empty payload.
+    """
+    return Response(status_code=status_code, headers={"location": url})
@@ -1,6 +1,5 @@
 from fastapi import APIRouter, HTTPException, Request, Form, UploadFile, File, Response
 from fastapi.responses import HTMLResponse, RedirectResponse, FileResponse
-from fastapi.templating import Jinja2Templates
 from datetime import date
 from decimal import Decimal
 import os
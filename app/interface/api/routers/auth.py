@@ -2,7 +2,6 @@ from datetime import timedelta, datetime
 from fastapi import APIRouter, Depends, HTTPException, status, Request
 from fastapi.security import OAuth2PasswordRequestForm
 from fastapi.responses import HTMLResponse
-from fastapi.templating import Jinja2Templates
 from typing import List
 
 from app.domain.auth.services import AuthService, ACCESS_TOKEN_EXPIRE_MINUTES
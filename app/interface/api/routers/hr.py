@@ -1,6 +1,5 @@
 from fastapi import APIRouter, HTTPException, Depends, Request, Form
 from fastapi.responses import HTMLResponse, RedirectResponse
-from fastapi.templating import Jinja2Templates
 from typing import List, Optional
 from datetime import date
 from decimal import Decimal
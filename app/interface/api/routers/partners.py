@@ -1,6 +1,5 @@
 from fastapi import APIRouter, HTTPException, Request, Form
 from fastapi.responses import HTMLResponse, RedirectResponse
-from fastapi.templating import Jinja2Templates
 import os
 
 from app.domain.partners.services import PartnerService
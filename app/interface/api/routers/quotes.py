@@ -1,6 +1,5 @@
 from fastapi import APIRouter, HTTPException, Depends
 from fastapi.responses import HTMLResponse, RedirectResponse
-from fastapi.templating import Jinja2Templates
 from fastapi import Request, Form
 from typing import List, Optional
 from datetime import date, timedelta
@@ -85,7 +84,7 @@ async def create_quote(
         )
         
         return RedirectResponse(url=f"/quotes/{quote.id}", status_code=303)
-    except Exception as e:
+    except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
@@ -118,7 +117,7 @@ async def send_quote(quote_id: str):
     try:
         quote = service.send_quote(quote_id)
         return RedirectResponse(url=f"/quotes/{quote.id}", status_code=303)
-    except Exception as e:
+    except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
@@ -130,7 +129,7 @@ async def accept_quote(quote_id: str):
     try:
         quote = service.accept_quote(quote_id)
         return RedirectResponse(url=f"/quotes/{quote.id}", status_code=303)
-    except Exception as e:
+    except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
@@ -142,7 +141,7 @@ async def reject_quote(quote_id: str):
     try:
         quote = service.reject_quote(quote_id)
         return RedirectResponse(url=f"/quotes/{quote.id}", status_code=303)
-    except Exception as e:
+    except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
@@ -154,7 +153,7 @@ async def delete_quote(quote_id: str):
     try:
         service.delete_quote(quote_id)
         return RedirectResponse(url="/quotes/", status_code=303)
-    except Exception as e:
+    except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
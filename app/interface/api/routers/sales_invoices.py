@@ -1,6 +1,6 @@
 from fastapi import APIRouter, HTTPException, Depends
-from fastapi.responses import HTMLResponse, RedirectResponse
-from fastapi.templating import Jinja2Templates
+from fastapi.responses import HTMLResponse
+from fastapi.concurrency import run_in_threadpool
 from fastapi import Request, Form
 from typing import List, Optional
 from datetime import date
@@ -10,16 +10,25 @@ from app.infrastructure.db.base import SessionLocal
 from app.domain.sales.services import SalesInvoiceService
 from app.domain.sales.entities import InvoiceStatus
 from app.domain.accounting.services import AccountingService
+from app.domain.accounting.mapping_service import AccountMappingService
+from app.domain.audit.services import AuditService
+from app.domain.inventory.services import InventoryService
+from app.domain.settings.services import SettingsService
+from app.domain.treasury.services import invalidate_cash_flow_forecast
 from app.infrastructure.persistence.sales.repository import (
     SqlAlchemySalesInvoiceRepository, SqlAlchemySalesOrderRepository
 )
 from app.infrastructure.persistence.partners.repository import SqlAlchemyPartnerRepository
 from app.infrastructure.persistence.accounts.repository import SqlAlchemyAccountRepository
 from app.infrastructure.persistence.accounting.repository import SqlAlchemyJournalRepository
+from app.infrastructure.persistence.audit.repository import SqlAlchemyAuditRepository
+from app.infrastructure.persistence.inventory.repositories import SqlAlchemyStockItemRepository, SqlAlchemyStockMovementRepository
+from app.infrastructure.persistence.settings.repository import SqlAlchemyCompanySettingsRepository
 
 
 router = APIRouter(prefix="/sales/invoices", tags=["sales_invoices"])
-from app.interface.api.templates import templates
+from app.interface.api.responses import redirect
+from app.interface.api.templates import templates, cached_template_response
 
 
 def get_invoice_service():
@@ -32,17 +41,12 @@ def get_invoice_service():
     journal_repo = SqlAlchemyJournalRepository(SessionLocal)
     accounting_service = AccountingService(account_repo, journal_repo)
     
-    from app.domain.accounting.mapping_service import AccountMappingService
     mapping_service = AccountMappingService()
     
-    from app.infrastructure.persistence.audit.repository import SqlAlchemyAuditRepository
-    from app.domain.audit.services import AuditService
     audit_repo = SqlAlchemyAuditRepository(SessionLocal)
     audit_service = AuditService(audit_repo)
 
     # Inventory Service Injection
-    from app.domain.inventory.services import InventoryService
-    from app.infrastructure.persistence.inventory.repositories import SqlAlchemyStockItemRepository, SqlAlchemyStockMovementRepository
     stock_item_repo = SqlAlchemyStockItemRepository(SessionLocal)
     stock_movement_repo = SqlAlchemyStockMovementRepository(SessionLocal)
     inventory_service = InventoryService(stock_item_repo, stock_movement_repo)
@@ -51,39 +55,35 @@ def get_invoice_service():
 
 
 @router.get("/", response_class=HTMLResponse)
-async def list_invoices(request: Request, status: Optional[str] = None):
+async def list_invoices(request: Request, status: Optional[str] = None, service: SalesInvoiceService = Depends(get_invoice_service)):
     """List all sales invoices."""
-    service = get_invoice_service()
-    
+    # Repositories are synchronous: run the query in the threadpool so the
+    # event loop keeps serving other requests while MySQL answers.
+    status_enum = None
     if status:
         try:
             status_enum = InvoiceStatus[status.upper()]
-            invoices = service.list_invoices(status=status_enum)
         except KeyError:
-            invoices = service.list_invoices()
-    else:
-        invoices = service.list_invoices()
+            pass
+    # Plain dict rows with partner names resolved in one IN (...) query
+    invoices = await run_in_threadpool(service.list_invoice_rows, status=status_enum)
     
-    return templates.TemplateResponse("sales/invoices/list.html", {
+    return cached_template_response(request, "sales/invoices/list.html", {
         "request": request,
         "invoices": invoices,
         "current_status": status
-    })
+    }, etag_source=(invoices, status))
 
 
 @router.get("/{invoice_id}", response_class=HTMLResponse)
-async def view_invoice(request: Request, invoice_id: str):
+async def view_invoice(request: Request, invoice_id: str, service: SalesInvoiceService = Depends(get_invoice_service)):
     """View invoice details."""
-    service = get_invoice_service()
-    invoice = service.get_invoice(invoice_id)
+    # Invoice, lines and partner in a single query
+    invoice, partner = service.get_invoice_with_partner(invoice_id)
     
     if not invoice:
         raise HTTPException(status_code=404, detail="Factura no trobada")
     
-    # Get partner details
-    partner_repo = SqlAlchemyPartnerRepository(SessionLocal)
-    partner = partner_repo.find_by_id(invoice.partner_id)
-    
     return templates.TemplateResponse("sales/invoices/view.html", {
         "request": request,
         "invoice": invoice,
@@ -92,58 +92,48 @@ async def view_invoice(request: Request, invoice_id: str):
 
 
 @router.post("/{invoice_id}/post")
-async def post_invoice(invoice_id: str):
+async def post_invoice(invoice_id: str, service: SalesInvoiceService = Depends(get_invoice_service)):
     """Post invoice and create journal entry."""
-    service = get_invoice_service()
-    
     try:
         invoice = service.post_invoice(invoice_id)
-        return RedirectResponse(url=f"/sales/invoices/{invoice.id}", status_code=303)
-    except Exception as e:
+        invalidate_cash_flow_forecast()
+        return redirect(f"/sales/invoices/{invoice.id}")
+    except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
 @router.post("/{invoice_id}/mark-paid")
-async def mark_as_paid(invoice_id: str):
+async def mark_as_paid(invoice_id: str, service: SalesInvoiceService = Depends(get_invoice_service)):
     """Mark invoice as paid."""
-    service = get_invoice_service()
-    
     try:
         invoice = service.mark_as_paid(invoice_id)
-        return RedirectResponse(url=f"/sales/invoices/{invoice.id}", status_code=303)
-    except Exception as e:
+        invalidate_cash_flow_forecast()
+        return redirect(f"/sales/invoices/{invoice.id}")
+    except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
 @router.post("/from-order/{order_id}")
-async def create_from_order(order_id: str, series: str = Form("A")):
+async def create_from_order(order_id: str, series: str = Form("A"), service: SalesInvoiceService = Depends(get_invoice_service)):
     """Create invoice from order."""
-    service = get_invoice_service()
-    
     try:
         invoice = service.create_from_order(order_id, series=series)
-        return RedirectResponse(url=f"/sales/invoices/{invoice.id}", status_code=303)
-    except Exception as e:
+        return redirect(f"/sales/invoices/{invoice.id}")
+    except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 from fastapi import Response
 from app.domain.sales.pdf_service import PdfService
 
 @router.get("/{invoice_id}/pdf")
-async def get_invoice_pdf(invoice_id: str):
+async def get_invoice_pdf(invoice_id: str, service: SalesInvoiceService = Depends(get_invoice_service)):
     """Generate and download PDF for invoice."""
-    service = get_invoice_service()
-    invoice = service.get_invoice(invoice_id)
+    invoice, partner = service.get_invoice_with_partner(invoice_id)
     
     if not invoice:
         raise HTTPException(status_code=404, detail="Factura no trobada")
-        
-    partner_repo = SqlAlchemyPartnerRepository(SessionLocal)
-    partner = partner_repo.find_by_id(invoice.partner_id)
     
     # Get Company Settings
-    from app.infrastructure.persistence.settings.repository import SqlAlchemyCompanySettingsRepository
-    from app.domain.settings.services import SettingsService
     settings_repo = SqlAlchemyCompanySettingsRepository(SessionLocal)
     settings_service = SettingsService(settings_repo)
     settings = settings_service.get_settings_or_default()
@@ -1,6 +1,6 @@
 from fastapi import APIRouter, HTTPException, Depends
-from fastapi.responses import HTMLResponse, RedirectResponse
-from fastapi.templating import Jinja2Templates
+from fastapi.responses import HTMLResponse
+from fastapi.concurrency import run_in_threadpool
 from fastapi import Request, Form
 from typing import List, Optional
 from datetime import date
@@ -11,7 +11,8 @@ from app.domain.sales.services import SalesOrderService
 from app.domain.sales.entities import OrderStatus
 from app.infrastructure.persistence.sales.repository import SqlAlchemySalesOrderRepository, SqlAlchemyQuoteRepository
 from app.infrastructure.persistence.partners.repository import SqlAlchemyPartnerRepository
-from app.interface.api.templates import templates
+from app.interface.api.responses import redirect
+from app.interface.api.templates import templates, cached_template_response
 
 
 router = APIRouter(prefix="/sales/orders", tags=["sales_orders"])
@@ -27,39 +28,35 @@ def get_order_service():
 
 
 @router.get("/", response_class=HTMLResponse)
-async def list_orders(request: Request, status: Optional[str] = None):
+async def list_orders(request: Request, status: Optional[str] = None, service: SalesOrderService = Depends(get_order_service)):
     """List all sales orders."""
-    service = get_order_service()
-    
+    # Repositories are synchronous: run the query in the threadpool so the
+    # event loop keeps serving other requests while MySQL answers.
+    status_enum = None
     if status:
         try:
             status_enum = OrderStatus[status.upper()]
-            orders = service.list_orders(status=status_enum)
         except KeyError:
-            orders = service.list_orders()
-    else:
-        orders = service.list_orders()
+            pass
+    # Plain dict rows with partner names resolved in one IN (...) query
+    orders = await run_in_threadpool(service.list_order_rows, status=status_enum)
     
-    return templates.TemplateResponse("sales/orders/list.html", {
+    return cached_template_response(request, "sales/orders/list.html", {
         "request": request,
         "orders": orders,
         "current_status": status
-    })
+    }, etag_source=(orders, status))
 
 
 @router.get("/{order_id}", response_class=HTMLResponse)
-async def view_order(request: Request, order_id: str):
+async def view_order(request: Request, order_id: str, service: SalesOrderService = Depends(get_order_service)):
     """View order details."""
-    service = get_order_service()
-    order = service.get_order(order_id)
+    # Order, lines and partner in a single query
+    order, partner = service.get_order_with_partner(order_id)
     
     if not order:
         raise HTTPException(status_code=404, detail="Comanda no trobada")
     
-    # Get partner details
-    partner_repo = SqlAlchemyPartnerRepository(SessionLocal)
-    partner = partner_repo.find_by_id(order.partner_id)
-    
     return templates.TemplateResponse("sales/orders/view.html", {
         "request": request,
         "order": order,
@@ -68,48 +65,40 @@ async def view_order(request: Request, order_id: str):
 
 
 @router.post("/{order_id}/confirm")
-async def confirm_order(order_id: str):
+async def confirm_order(order_id: str, service: SalesOrderService = Depends(get_order_service)):
     """Confirm a sales order."""
-    service = get_order_service()
-    
     try:
         order = service.confirm_order(order_id)
-        return RedirectResponse(url=f"/sales/orders/{order.id}", status_code=303)
-    except Exception as e:
+        return redirect(f"/sales/orders/{order.id}")
+    except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
 @router.post("/{order_id}/deliver")
-async def deliver_order(order_id: str):
+async def deliver_order(order_id: str, service: SalesOrderService = Depends(get_order_service)):
     """Mark order as delivered."""
-    service = get_order_service()
-    
     try:
         order = service.deliver_order(order_id)
-        return RedirectResponse(url=f"/sales/orders/{order.id}", status_code=303)
-    except Exception as e:
+        return redirect(f"/sales/orders/{order.id}")
+    except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
 @router.post("/{order_id}/cancel")
-async def cancel_order(order_id: str):
+async def cancel_order(order_id: str, service: SalesOrderService = Depends(get_order_service)):
     """Cancel a sales order."""
-    service = get_order_service()
-    
     try:
         order = service.cancel_order(order_id)
-        return RedirectResponse(url=f"/sales/orders/{order.id}", status_code=303)
-    except Exception as e:
+        return redirect(f"/sales/orders/{order.id}")
+    except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
 @router.post("/from-quote/{quote_id}")
-async def create_from_quote(quote_id: str):
+async def create_from_quote(quote_id: str, service: SalesOrderService = Depends(get_order_service)):
     """Create order from quote."""
-    service = get_order_service()
-    
     try:
         order = service.create_from_quote(quote_id)
-        return RedirectResponse(url=f"/sales/orders/{order.id}", status_code=303)
-    except Exception as e:
+        return redirect(f"/sales/orders/{order.id}")
+    except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -1,7 +1,12 @@
 from fastapi import APIRouter, Request, Form, Depends, UploadFile, File
 from fastapi.responses import HTMLResponse, RedirectResponse
-from typing import Optional
-from app.interface.api.templates import templates
+from fastapi.concurrency import run_in_threadpool
+from typing import BinaryIO, Optional
+import hashlib
+import os
+import tempfile
+from app.interface.api.responses import redirect
+from app.interface.api.templates import cached_template_response
 from app.infrastructure.db.base import SessionLocal
 from app.domain.settings.services import SettingsService
 from app.domain.settings.entities import CompanySettings
@@ -11,6 +16,27 @@ from app.domain.auth.entities import User
 
 router = APIRouter(prefix="/settings", tags=["settings"])
 
+LOGO_UPLOAD_DIR = "frontend/static/uploads/company"
+LOGO_URL_PREFIX = "/static/uploads/company"
+
+
+def _store_logo(src: BinaryIO, original_filename: str) -> str:
+    """Copy an uploaded logo to disk under a content-hash name and return its URL."""
+    os.makedirs(LOGO_UPLOAD_DIR, exist_ok=True)
+    extension = os.path.splitext(original_filename)[1].lower() or ".png"
+    digest = hashlib.sha256()
+    # Write to a private temp file first so concurrent uploads never share a path
+    fd, tmp_path = tempfile.mkstemp(dir=LOGO_UPLOAD_DIR)
+    with os.fdopen(fd, "wb") as buffer:
+        for chunk in iter(lambda: src.read(1 << 20), b""):
+            digest.update(chunk)
+            buffer.write(chunk)
+    os.chmod(tmp_path, 0o644)  # mkstemp creates owner-only files
+    filename = f"logo_{digest.hexdigest()[:16]}{extension}"
+    os.replace(tmp_path, os.path.join(LOGO_UPLOAD_DIR, filename))
+    return f"{LOGO_URL_PREFIX}/{filename}"
+
+
 def get_settings_service():
     repo = SqlAlchemyCompanySettingsRepository(SessionLocal)
     return SettingsService(repo)
@@ -18,20 +44,20 @@ def get_settings_service():
 @router.get("/", response_class=HTMLResponse)
 async def settings_form(
     request: Request,
-    current_user: Optional[User] = Depends(get_current_user_or_redirect)
+    current_user: Optional[User] = Depends(get_current_user_or_redirect),
+    service: SettingsService = Depends(get_settings_service)
 ):
     """Show settings form."""
     if current_user is None:
         return RedirectResponse(url="/auth/login-page", status_code=302)
         
-    service = get_settings_service()
     settings = service.get_settings_or_default()
     
-    return templates.TemplateResponse("settings/edit.html", {
+    return cached_template_response(request, "settings/edit.html", {
         "request": request,
         "user": current_user,
         "settings": settings
-    })
+    }, etag_source=(current_user, settings))
 
 @router.post("/update")
 async def update_settings(
@@ -55,33 +81,19 @@ async def update_settings(
     sii_test_mode: str = Form(None),
     sii_certificate_path: str = Form(""),
     sii_certificate_password: str = Form(""),
-    logo: UploadFile = File(None)
+    logo: UploadFile = File(None),
+    service: SettingsService = Depends(get_settings_service)
 ):
     """Update settings."""
-    service = get_settings_service()
-    
-    # Handle logo upload (simplified for now: save to static/uploads/logo or generic)
+    # Handle logo upload. The copy is blocking file I/O, so run it in the
+    # threadpool instead of stalling the event loop for the whole upload.
     logo_url = None
     if logo and logo.filename:
-        # Save logic here? Or keep previous url.
-        # For MVP, assume simplistic handling or skip logo file persistence implementation detail for this turn
-        # Actually I should implement it:
-        import os
-        import shutil
-        upload_dir = "frontend/static/uploads/company"
-        os.makedirs(upload_dir, exist_ok=True)
-        file_path = f"{upload_dir}/logo.png" # Force name for simplicity or use timestamp
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(logo.file, buffer)
-        logo_url = "/static/uploads/company/logo.png"
-    
-    # Needs to handle "keep existing logo if no new one uploaded"
-    current_settings = service.get_settings()
-    if not logo_url and current_settings and current_settings.logo_url:
-        logo_url = current_settings.logo_url
+        logo_url = await run_in_threadpool(_store_logo, logo.file, logo.filename)
 
+    # No need to read the current row first: the repository updates the
+    # singleton in place and keeps the existing logo when logo_url is None.
     new_settings = CompanySettings(
-        id=current_settings.id if current_settings else None, # Preserve ID or let init generate new (but logic handles update via Singleton Check)
         name=name,
         tax_id=tax_id,
         address_street=address_street,
@@ -107,4 +119,4 @@ async def update_settings(
     
     service.save_settings(new_settings)
     
-    return RedirectResponse(url="/settings", status_code=303)
+    return redirect("/settings")
@@ -1,47 +1,51 @@
 from fastapi import APIRouter, Request, Form, Depends
-from fastapi.responses import HTMLResponse, RedirectResponse
-from app.interface.api.templates import templates
+from fastapi.responses import HTMLResponse
+from fastapi.concurrency import run_in_threadpool
+from app.interface.api.responses import redirect
+from app.interface.api.templates import templates, cached_template_response
 from app.infrastructure.persistence.treasury.repository import SqlAlchemyTreasuryRepository
 from app.infrastructure.persistence.sales.repository import SqlAlchemySalesInvoiceRepository
 from app.domain.treasury.services import TreasuryService
+from app.domain.accounting.services import AccountingService
+from app.infrastructure.db.base import SessionLocal
+from app.infrastructure.persistence.accounts.repository import SqlAlchemyAccountRepository
+from app.infrastructure.persistence.accounting.repository import SqlAlchemyJournalRepository
+from app.infrastructure.persistence.hr.repository import SqlAlchemyPayrollRepository
 
 router = APIRouter()
 
 def get_treasury_service():
-    from app.infrastructure.db.base import SessionLocal
     treasury_repo = SqlAlchemyTreasuryRepository()
     sales_repo = SqlAlchemySalesInvoiceRepository(SessionLocal)
     
     # Optional: Add accounting service for cash balance
-    from app.domain.accounting.services import AccountingService
-    from app.infrastructure.persistence.accounts.repository import SqlAlchemyAccountRepository
-    from app.infrastructure.persistence.accounting.repository import SqlAlchemyJournalRepository
     account_repo = SqlAlchemyAccountRepository(SessionLocal)
     journal_repo = SqlAlchemyJournalRepository(SessionLocal)
     accounting_service = AccountingService(account_repo, journal_repo)
     
     # Optional: Add payroll repo for expenses
-    from app.infrastructure.persistence.hr.repository import SqlAlchemyPayrollRepository
     payroll_repo = SqlAlchemyPayrollRepository(SessionLocal)
     
     return TreasuryService(treasury_repo, sales_repo, accounting_service, payroll_repo)
 
 @router.get("/treasury/cash-flow", response_class=HTMLResponse)
-async def cash_flow_forecast(request: Request, days: int = 30):
-    service = get_treasury_service()
+async def cash_flow_forecast(request: Request, days: int = 30, service: TreasuryService = Depends(get_treasury_service)):
     forecast = service.get_cash_flow_forecast(days)
-    return templates.TemplateResponse(
+    return cached_template_response(
+        request,
         "treasury/cash_flow.html",
-        {"request": request, "forecast": forecast, "days": days}
+        {"request": request, "forecast": forecast, "days": days},
+        etag_source=(forecast, days)
     )
 
 @router.get("/treasury/accounts", response_class=HTMLResponse)
-async def list_bank_accounts(request: Request):
-    service = get_treasury_service()
-    accounts = service.list_bank_accounts()
-    return templates.TemplateResponse(
+async def list_bank_accounts(request: Request, service: TreasuryService = Depends(get_treasury_service)):
+    accounts = await run_in_threadpool(service.list_bank_accounts)
+    return cached_template_response(
+        request,
         "treasury/accounts_list.html",
-        {"request": request, "accounts": accounts}
+        {"request": request, "accounts": accounts},
+        etag_source=accounts
     )
 
 @router.get("/treasury/accounts/new", response_class=HTMLResponse)
@@ -57,14 +61,13 @@ async def create_bank_account(
     name: str = Form(...),
     iban: str = Form(...),
     bic: str = Form(None),
-    account_code: str = Form(None)
+    account_code: str = Form(None),
+    service: TreasuryService = Depends(get_treasury_service)
 ):
-    service = get_treasury_service()
     service.create_bank_account(name, iban, bic, account_code)
-    return RedirectResponse(url="/treasury/accounts", status_code=303)
+    return redirect("/treasury/accounts")
 
 @router.get('/treasury/forecast', response_class=HTMLResponse)
-async def treasury_dashboard(request: Request):
-    service = get_treasury_service()
+async def treasury_dashboard(request: Request, service: TreasuryService = Depends(get_treasury_service)):
     dashboard = service.get_treasury_dashboard()
     return templates.TemplateResponse('treasury/forecast.html', {'request': request, 'dashboard': dashboard})
@@ -1,19 +1,93 @@
+from fastapi import Request, Response
 from fastapi.templating import Jinja2Templates
+from jinja2 import FileSystemBytecodeCache, TemplateError
+from typing import Any
+import hashlib
+import logging
 import os
+from pathlib import Path
 
-# Determine path to frontend/templates
-# This file is deep in app/interface/api/templates.py
-# Root is ../../../
-current_dir = os.path.dirname(os.path.abspath(__file__))
-# Go up 3 levels to reach 'app' root, then one more to reach project root, then down to frontend
-# Actually:
-# c:\ERP\app\interface\api\templates.py (current)
-# c:\ERP\app\interface\api (..)
-# c:\ERP\app\interface (../..)
-# c:\ERP\app (../../..)
-# c:\ERP (../../../..)
-# c:\ERP\frontend\templates
-project_root = os.path.abspath(os.path.join(current_dir, "../../../"))
-templates_dir = os.path.join(project_root, "frontend/templates")
-
-templates = Jinja2Templates(directory=templates_dir, auto_reload=True)
+from app.config import APP_ENV
+
+# app/interface/api/templates.py -> parents[3] is the project root (c:\ERP)
+project_root = Path(__file__).resolve().parents[3]
+templates_path = project_root / "frontend" / "templates"
+templates_dir = str(templates_path)
+
+# Fail at import rather than on the first request if the tree is incomplete
+if not templates_path.is_dir():
+    raise RuntimeError(f"No s'ha trobat el directori de plantilles: {templates_dir}")
+
+# Single shared instance: every router imports this one so each template is
+# compiled once per process. Only check template mtimes while developing, and
+# never evict compiled templates from the cache (cache_size=-1).
+templates = Jinja2Templates(
+    directory=templates_dir,
+    auto_reload=APP_ENV == "development",
+    cache_size=-1
+)
+
+# Persist compiled bytecode in the per-user temp directory so new workers and
+# restarts load it instead of parsing the template sources again.
+templates.env.bytecode_cache = FileSystemBytecodeCache()
+
+logger = logging.getLogger(__name__)
+
+
+def precompile_templates() -> int:
+    """Compile every HTML template up front so the first request doesn't pay for it."""
+    compiled = 0
+    for name in templates.env.list_templates(extensions=["html"]):
+        try:
+            templates.env.get_template(name)
+            compiled += 1
+        except TemplateError as e:
+            logger.warning("Template %s could not be compiled: %s", name, e)
+    return compiled
+
+
+_templates_version = None
+
+
+def templates_version() -> str:
+    """Fingerprint of every template file (name and mtime).
+
+    Pages extend base.html and pull in includes, so a page's ETag has to change
+    when any template changes, not only its own. Computed once per process, or
+    on every call while auto_reload is on (development).
+    """
+    global _templates_version
+    if _templates_version is None or templates.env.auto_reload:
+        digest = hashlib.sha1()
+        for name in sorted(templates.env.list_templates()):
+            digest.update(f"{name}:{os.path.getmtime(templates_path / name)}\n".encode("utf-8"))
+        _templates_version = digest.hexdigest()
+    return _templates_version
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison of ``etag`` against an If-None-Match list (RFC 9110)."""
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or (tag[2:] if tag.startswith("W/") else tag) == opaque:
+            return True
+    return False
+
+
+def cached_template_response(request: Request, name: str, context: dict, etag_source: Any) -> Response:
+    """Render a GET page with a weak ETag, answering 304 when the client already has it.
+
+    ``etag_source`` is the data the page is built from (entities are dataclasses,
+    so their repr covers every field). It is hashed with the page name and
+    templates_version(), so a deploy that changes the page, its layout or an
+    include invalidates the cached page too. Browsers must revalidate on every
+    visit, which keeps lists fresh right after an edit but skips rendering when
+    nothing changed.
+    """
+    digest = hashlib.sha1(f"{templates_version()}|{name}|{etag_source!r}".encode("utf-8")).hexdigest()
+    etag = f'W/"{digest}"'
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if _etag_matches(request.headers.get("if-none-match", ""), etag):
+        return Response(status_code=304, headers=headers)
+    return templates.TemplateResponse(name, context, headers=headers)
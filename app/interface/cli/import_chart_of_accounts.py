@@ -0,0 +1,32 @@
+"""
+Importa un pla comptable des d'un fitxer JSON.
+
+Format: llista d'objectes amb code, name, type (ASSET, LIABILITY, EQUITY,
+INCOME, EXPENSE), group i opcionalment parent_code. Els comptes que ja
+existeixen s'ometen.
+
+Ús: contacat-import-accounts chart_of_accounts_es.json
+    (o bé: python -m app.interface.cli.import_chart_of_accounts chart_of_accounts_es.json)
+"""
+import sys
+import json
+
+from app.domain.accounts.services import AccountService
+from app.infrastructure.persistence.accounts.repository import SqlAlchemyAccountRepository
+
+
+def main():
+    if len(sys.argv) != 2:
+        print(__doc__)
+        sys.exit(1)
+
+    with open(sys.argv[1], "rb") as f:
+        accounts_data = json.load(f)
+
+    service = AccountService(SqlAlchemyAccountRepository())
+    created = service.import_accounts(accounts_data)
+    print(f"[OK] {created} comptes creats, {len(accounts_data) - created} ja existien")
+
+
+if __name__ == "__main__":
+    main()
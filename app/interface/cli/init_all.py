@@ -0,0 +1,15 @@
+"""
+Inicialitza la base de dades: crea totes les taules de tots els mòduls
+(comptabilitat, vendes, banca, pressupostos, finançament,
+configuració...) amb un únic create_all.
+"""
+from app.infrastructure.db.base import init_db
+
+
+def main():
+    init_db()
+    print("[OK] Taules creades/verificades")
+
+
+if __name__ == "__main__":
+    main()
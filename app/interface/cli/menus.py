@@ -1,5 +1,17 @@
+import sys
+from itertools import chain
+
 from app.domain.accounts.services import AccountService
 
+_MAIN_MENU = (
+    "\n=== ERP Accounting (CLI) ===\n"
+    "1. Add account\n"
+    "2. List accounts\n"
+    "0. Exit\n"
+)
+# Bound once so listing doesn't re-parse the format spec for every row
+_ACCOUNT_ROW = "{:>8} | {:<30} | {:<8} | {}".format
+
 
 class CliApp:
     def __init__(self, account_service: AccountService):
@@ -22,10 +34,7 @@ class CliApp:
 
     @staticmethod
     def _print_main_menu():
-        print("\n=== ERP Accounting (CLI) ===")
-        print("1. Add account")
-        print("2. List accounts")
-        print("0. Exit")
+        sys.stdout.write(_MAIN_MENU)
 
     def _handle_create_account(self):
         print("\n--- New Account ---")
@@ -43,12 +52,15 @@ class CliApp:
             print(f"Unexpected error: {e}")
 
     def _handle_list_accounts(self):
-        accounts = self._account_service.get_chart_of_accounts()
+        accounts = self._account_service.iter_accounts()
         print("\n--- Chart of Accounts ---")
-        if not accounts:
+        first = next(accounts, None)
+        if first is None:
             print("No accounts yet.")
             return
 
-        for acc in accounts:
-            status = "ACTIVE" if acc.is_active else "INACTIVE"
-            print(f"{acc.code:>8} | {acc.name:<30} | {acc.account_type:<8} | {status}")
+        # Stream rows straight to stdout instead of building the whole listing
+        sys.stdout.writelines(
+            _ACCOUNT_ROW(acc.code, acc.name, acc.account_type, "ACTIVE" if acc.is_active else "INACTIVE") + "\n"
+            for acc in chain((first,), accounts)
+        )
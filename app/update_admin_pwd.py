@@ -1,20 +1,32 @@
-from app.domain.auth.services import pwd_context
+import sys
+
+from sqlalchemy.dialects.mysql import insert
+
+from app.domain.auth.entities import UserRole
+from app.domain.auth.services import reset_password_context
 from app.infrastructure.db.base import SessionLocal
 from app.infrastructure.persistence.auth.models import UserModel
 
+# Production bcrypt cost unless --fast-hash is passed explicitly
+pwd_context = reset_password_context(sys.argv[1:])
+
 # Create hash
 new_hash = pwd_context.hash("admin123")
 print(f"New hash created: {new_hash}")
 
-# Update database
-db = SessionLocal()
-try:
-    user = db.query(UserModel).filter(UserModel.username == "admin").first()
-    if user:
-        user.password_hash = new_hash
-        db.commit()
-        print(f"Password updated for user: {user.username}")
-    else:
-        print("Admin user not found!")
-finally:
-    db.close()
+# Create or reset the admin user with a single upsert; the transaction
+# commits on success and rolls back on error.
+stmt = insert(UserModel).values(
+    username="admin",
+    password_hash=new_hash,
+    role=UserRole.ADMIN,
+    is_active=True
+)
+stmt = stmt.on_duplicate_key_update(
+    password_hash=stmt.inserted.password_hash,
+    role=UserRole.ADMIN
+)
+
+with SessionLocal.begin() as db:
+    db.execute(stmt)
+print("Password updated for user: admin")
@@ -5,50 +5,335 @@ Executes all verification tests and checks system configuration
 """
 import sys
 import os
+import io
+import argparse
+import asyncio
+import hashlib
+import json
+import logging
+import tempfile
+import contextlib
+import multiprocessing
+import runpy
+import signal
 import subprocess
+import threading
+import time
+import traceback
+from collections import deque
 from pathlib import Path
 
+# forkserver is POSIX-only; on Windows each test still gets its own interpreter
+USE_FORKSERVER = "forkserver" in multiprocessing.get_all_start_methods()
+
 def print_header(text):
     print("\n" + "="*60)
     print(f"  {text}")
     print("="*60)
 
-def run_test(test_file, test_name):
-    """Run a verification test and return success status"""
-    print(f"\n[INFO] Running {test_name}...")
+TEST_TIMEOUT_SECONDS = 30
+
+# Only the last lines of a test's output are kept for the report
+OUTPUT_TAIL_LINES = 200
+
+# Heavy imports shared by every verification script. A forkserver imports them
+# once and forks each test from that warm interpreter instead of starting a
+# fresh Python per script.
+FORKSERVER_PRELOAD = [
+    "sqlalchemy",
+    "fastapi",
+    "app.infrastructure.db.base",
+    "app.interface.api.main",
+]
+
+def _kill_process_group(process):
+    """Kill a test and anything it spawned (POSIX); fall back to the child alone."""
+    if hasattr(os, "killpg"):
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+            return
+        except ProcessLookupError:
+            return
+    process.kill()
+
+class _LineSender(io.TextIOBase):
+    """Text stream that sends each completed line to the parent over a pipe.
+
+    Lines leave the child as they are written, so the parent still has the
+    output seen so far if it has to kill a hung test.
+    """
+
+    def __init__(self, conn):
+        self._conn = conn
+        self._partial = ""
+        self._lock = threading.Lock()
+
+    def writable(self):
+        return True
+
+    def write(self, text):
+        with self._lock:
+            *complete, self._partial = (self._partial + text).split("\n")
+            for line in complete:
+                self._conn.send(("line", line))
+        return len(text)
+
+    def send_result(self, returncode):
+        with self._lock:
+            if self._partial:
+                self._conn.send(("line", self._partial))
+                self._partial = ""
+            self._conn.send(("done", returncode))
+
+def _redirect_log_handlers(stream):
+    """Point stream handlers that write to the console at ``stream``.
+
+    Modules preloaded in the forkserver (the engine with echo=True) attach
+    their StreamHandler to the real stdout before any test runs, so
+    redirect_stdout alone would not capture their output.
+    """
+    console = {sys.stdout, sys.stderr, sys.__stdout__, sys.__stderr__}
+    loggers = [logging.getLogger()] + [
+        logger for logger in logging.Logger.manager.loggerDict.values()
+        if isinstance(logger, logging.Logger)
+    ]
+    for logger in loggers:
+        for handler in logger.handlers:
+            if type(handler) is logging.StreamHandler and handler.stream in console:
+                handler.setStream(stream)
+
+def _execute_script(test_file, conn):
+    """Child side: run a script as __main__, streaming its output and then its exit code."""
+    output = _LineSender(conn)
+    returncode = 0
+    _redirect_log_handlers(output)
+    with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+        try:
+            runpy.run_path(test_file, run_name="__main__")
+        except SystemExit as e:
+            if e.code is None:
+                returncode = 0
+            elif isinstance(e.code, int):
+                returncode = e.code
+            else:
+                print(e.code, file=sys.stderr)
+                returncode = 1
+        except BaseException:
+            traceback.print_exc()
+            returncode = 1
+    output.send_result(returncode)
+    conn.close()
+
+def _run_in_forkserver(test_file):
+    ctx = multiprocessing.get_context("forkserver")
+    receiver, sender = ctx.Pipe(duplex=False)
+    process = ctx.Process(target=_execute_script, args=(test_file, sender))
+    process.start()
+    sender.close()
+    # Keep only the tail of what the test printed, as it arrives
+    tail = deque(maxlen=OUTPUT_TAIL_LINES)
+    deadline = time.monotonic() + TEST_TIMEOUT_SECONDS
+    try:
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not receiver.poll(remaining):
+                process.kill()
+                raise TimeoutError(list(tail))
+            kind, value = receiver.recv()
+            if kind == "done":
+                return value, list(tail)
+            tail.append(value)
+    except EOFError:
+        # Child died without reporting (e.g. os._exit or a crash)
+        tail.append("Test process exited without reporting a result")
+        process.join()
+        return process.exitcode or 1, list(tail)
+    finally:
+        process.join()
+        receiver.close()
+
+async def _run_in_subprocess(test_file):
+    process = await asyncio.create_subprocess_exec(
+        sys.executable, test_file,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT,
+        start_new_session=True
+    )
+    # Drain the pipe as the test writes, keeping only the tail
+    tail = deque(maxlen=OUTPUT_TAIL_LINES)
+
+    async def drain():
+        async for line in process.stdout:
+            tail.append(line.decode(errors="replace").rstrip("\n"))
+        return await process.wait()
+
     try:
-        result = subprocess.run(
-            [sys.executable, test_file],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
+        returncode = await asyncio.wait_for(drain(), timeout=TEST_TIMEOUT_SECONDS)
+    except asyncio.TimeoutError:
+        _kill_process_group(process)
+        await process.wait()
+        raise TimeoutError(list(tail))
+    return returncode, list(tail)
+
+async def run_test(test_file, test_name):
+    """Run a verification test and return (success, report).
+
+    Output is buffered in the report instead of printed, so tests running in
+    parallel don't interleave their logs.
+    """
+    report = [f"\n[INFO] Running {test_name}..."]
+    try:
+        if USE_FORKSERVER:
+            returncode, output = await asyncio.to_thread(_run_in_forkserver, test_file)
+        else:
+            returncode, output = await _run_in_subprocess(test_file)
         
-        if result.returncode == 0:
-            print(f"[SUCCESS] {test_name} PASSED")
-            return True
+        if returncode == 0:
+            report.append(f"[SUCCESS] {test_name} PASSED")
+            return True, "\n".join(report)
         else:
-            print(f"[FAILURE] {test_name} FAILED")
-            print("STDOUT:", result.stdout[-500:])
-            print("STDERR:", result.stderr[-500:])
-            return False
-    except subprocess.TimeoutExpired:
-        print(f"[FAILURE] {test_name} TIMEOUT")
-        return False
+            report.append(f"[FAILURE] {test_name} FAILED")
+            report.append("OUTPUT:")
+            report.extend(output)
+            return False, "\n".join(report)
+    except TimeoutError as e:
+        report.append(f"[FAILURE] {test_name} TIMEOUT")
+        partial_output = e.args[0] if e.args else []
+        if partial_output:
+            report.append("OUTPUT (before timeout):")
+            report.extend(partial_output)
+        return False, "\n".join(report)
     except Exception as e:
-        print(f"[ERROR] {test_name} ERROR: {e}")
-        return False
+        report.append(f"[ERROR] {test_name} ERROR: {e}")
+        return False, "\n".join(report)
 
-def check_file_exists(filepath, description):
-    """Check if a critical file exists"""
-    if os.path.exists(filepath):
-        print(f"[OK] {description}: {filepath}")
-        return True
-    else:
-        print(f"[MISSING] {description}: {filepath}")
-        return False
+async def run_tests(tests, max_parallel):
+    """Run (file, name, parallel_safe) tests and return their results in input order.
+
+    Read-only tests run side by side (at most max_parallel at once). Tests that
+    write to the database run one after another: invoice and journal entry
+    numbers come from MAX+1 lookups, so two writers at once can pick the same one.
+    """
+    semaphore = asyncio.Semaphore(max_parallel)
+
+    async def limited(test_file, test_name):
+        async with semaphore:
+            return await run_test(test_file, test_name)
+
+    async def one_by_one(writers):
+        return [await run_test(test_file, test_name) for test_file, test_name, _ in writers]
+
+    readers = [test for test in tests if test[2]]
+    writers = [test for test in tests if not test[2]]
+    reader_results, writer_results = await asyncio.gather(
+        asyncio.gather(*(limited(test_file, test_name) for test_file, test_name, _ in readers)),
+        one_by_one(writers)
+    )
+    reader_results, writer_results = iter(reader_results), iter(writer_results)
+    return [next(reader_results) if test[2] else next(writer_results) for test in tests]
+
+def check_files_exist(files):
+    """Check that critical files exist, listing each parent directory only once."""
+    listings = {}
+    all_found = True
+    for filepath, description in files:
+        directory, name = os.path.split(filepath)
+        if directory not in listings:
+            try:
+                with os.scandir(directory or ".") as entries:
+                    listings[directory] = {entry.name for entry in entries}
+            except FileNotFoundError:
+                listings[directory] = set()
+        if name in listings[directory]:
+            print(f"[OK] {description}: {filepath}")
+        else:
+            print(f"[MISSING] {description}: {filepath}")
+            all_found = False
+    return all_found
+
+# Settings that app/config.py otherwise fills with insecure development defaults
+REQUIRED_ENV_KEYS = ("SECRET_KEY", "DB_PASSWORD")
+
+def find_env_keys(path, keys):
+    """Return which of keys have a non-empty value in an env file.
+
+    Reads line by line and stops as soon as every key has been found.
+    """
+    wanted = set(keys)
+    found = set()
+    with open(path, 'r') as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#") or "=" not in line:
+                continue
+            key, value = line.split("=", 1)
+            key = key.strip()
+            if key in wanted and value.strip():
+                found.add(key)
+                if found == wanted:
+                    break
+    return found
+
+PIP_CHECK_CACHE = Path.home() / ".contacat_cache" / "pipcheck.json"
+
+def requirements_fingerprint(requirements_file="requirements.txt"):
+    """Hash of requirements.txt plus the interpreter, so a passing pip check can be reused."""
+    digest = hashlib.sha256()
+    with open(requirements_file, "rb") as f:
+        digest.update(f.read())
+    digest.update(sys.version.encode())
+    digest.update(sys.executable.encode())
+    return digest.hexdigest()
+
+def _load_json(path):
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def _save_json(path, data):
+    """Written via os.replace so readers never see half a file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent)
+    with os.fdopen(fd, "w") as f:
+        json.dump(data, f)
+    os.replace(tmp_path, path)
+
+def load_pip_check_cache():
+    return _load_json(PIP_CHECK_CACHE)
+
+def save_pip_check_cache(fingerprint):
+    """Record a passing pip check."""
+    _save_json(PIP_CHECK_CACHE, {"hash": fingerprint, "ok": True})
+
+PASSED_TESTS_CACHE = PIP_CHECK_CACHE.parent / "passed_tests.json"
+
+def clean_git_head():
+    """HEAD commit sha, or None if git is unavailable or tracked files have local changes.
+
+    Tests exercise the whole app, not just their own file, so a pass is only
+    reused for exactly the same committed tree.
+    """
+    try:
+        head = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True)
+        status = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"],
+                                capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    if status.stdout.strip():
+        return None
+    return head.stdout.strip()
+
+def test_fingerprint(test_file, head):
+    return {"mtime": os.path.getmtime(test_file), "head": head}
 
 def main():
+    parser = argparse.ArgumentParser(description="ContaCAT production readiness check")
+    parser.add_argument("--force", action="store_true",
+                        help="run every verification test even if it passed before on this commit")
+    args = parser.parse_args()
+    
     print_header("ContaCAT ERP - Production Readiness Check")
     
     # Change to project root
@@ -59,11 +344,12 @@ def main():
     
     # 1. File Structure Check
     print_header("1. Checking Critical Files")
-    files_ok = True
-    files_ok &= check_file_exists("app/interface/api/main.py", "Main Application")
-    files_ok &= check_file_exists("app/infrastructure/db/base.py", "Database Config")
-    files_ok &= check_file_exists("requirements.txt", "Dependencies")
-    files_ok &= check_file_exists("scripts/init_db.py", "DB Initialization")
+    files_ok = check_files_exist([
+        ("app/interface/api/main.py", "Main Application"),
+        ("app/infrastructure/db/base.py", "Database Config"),
+        ("requirements.txt", "Dependencies"),
+        ("app/interface/cli/init_all.py", "DB Initialization"),
+    ])
     
     if not files_ok:
         print("\n[WARNING] Some critical files are missing!")
@@ -72,18 +358,47 @@ def main():
     # 2. Verification Tests
     print_header("2. Running Verification Tests")
     
+    # (file, name, parallel_safe): only read-only checks may run concurrently
     tests = [
-        ("tests/verify_sales.py", "Sales Module"),
-        ("tests/verify_inventory.py", "Inventory Integration"),
-        ("tests/verify_hr.py", "HR Payroll Calculations")
+        ("tests/verify_sales.py", "Sales Module", False),
+        ("tests/verify_inventory.py", "Inventory Integration", False),
+        ("tests/verify_hr.py", "HR Payroll Calculations", False)
     ]
     
+    if USE_FORKSERVER:
+        multiprocessing.set_forkserver_preload(FORKSERVER_PRELOAD)
+    
+    # Skip tests that already passed on this same commit
     tests_passed = 0
-    for test_file, test_name in tests:
-        if run_test(test_file, test_name):
+    head = clean_git_head()
+    passed_cache = {} if head is None else _load_json(PASSED_TESTS_CACHE)
+    pending = []
+    for test_file, test_name, parallel_safe in tests:
+        key = str(Path(test_file).resolve())
+        if not args.force and passed_cache.get(key) == test_fingerprint(test_file, head):
+            print(f"\n[CACHED PASS] {test_name}")
             tests_passed += 1
         else:
-            all_passed = False
+            pending.append((test_file, test_name, parallel_safe))
+    
+    # Read-only scripts run side by side, the ones that write to the database
+    # one at a time; reports are printed in a stable order once all have finished.
+    if pending:
+        readers = sum(1 for _, _, parallel_safe in pending if parallel_safe)
+        max_parallel = min(max(1, readers), max(1, (os.cpu_count() or 1) - 2))
+        results = asyncio.run(run_tests(pending, max_parallel))
+        for (test_file, test_name, _), (passed, report) in zip(pending, results):
+            print(report)
+            key = str(Path(test_file).resolve())
+            if passed:
+                tests_passed += 1
+                if head is not None:
+                    passed_cache[key] = test_fingerprint(test_file, head)
+            else:
+                all_passed = False
+                passed_cache.pop(key, None)
+        if head is not None:
+            _save_json(PASSED_TESTS_CACHE, passed_cache)
     
     print(f"\n[INFO] Tests Passed: {tests_passed}/{len(tests)}")
     
@@ -93,13 +408,13 @@ def main():
     env_file = ".env"
     if os.path.exists(env_file):
         print(f"[OK] .env file exists")
-        # Check for critical vars
-        with open(env_file, 'r') as f:
-            env_content = f.read()
-            if "SECRET_KEY" in env_content:
-                print("[OK] SECRET_KEY is configured")
+        # Check all critical vars in a single pass over the file
+        found = find_env_keys(env_file, REQUIRED_ENV_KEYS)
+        for key in REQUIRED_ENV_KEYS:
+            if key in found:
+                print(f"[OK] {key} is configured")
             else:
-                print("[WARNING] SECRET_KEY not found in .env")
+                print(f"[WARNING] {key} not found in .env")
                 all_passed = False
     else:
         print(f"[WARNING] .env file not found - create it for production!")
@@ -109,17 +424,24 @@ def main():
     # 4. Dependencies Check
     print_header("4. Checking Dependencies")
     try:
-        result = subprocess.run(
-            [sys.executable, "-m", "pip", "check"],
-            capture_output=True,
-            text=True
-        )
-        if "No broken requirements found" in result.stdout or result.returncode == 0:
-            print("[OK] All dependencies are satisfied")
+        fingerprint = requirements_fingerprint()
+        cache = load_pip_check_cache()
+        if cache.get("hash") == fingerprint and cache.get("ok"):
+            # Same requirements and interpreter as the last passing run
+            print("[OK] All dependencies are satisfied (cached)")
         else:
-            print("[WARNING] Dependency issues detected:")
-            print(result.stdout)
-            all_passed = False
+            result = subprocess.run(
+                [sys.executable, "-m", "pip", "check"],
+                capture_output=True,
+                text=True
+            )
+            if "No broken requirements found" in result.stdout or result.returncode == 0:
+                print("[OK] All dependencies are satisfied")
+                save_pip_check_cache(fingerprint)
+            else:
+                print("[WARNING] Dependency issues detected:")
+                print(result.stdout)
+                all_passed = False
     except Exception as e:
         print(f"[ERROR] Could not check dependencies: {e}")
     
@@ -154,9 +476,9 @@ Your system is NOT ready for production deployment.
 Please fix the issues listed above before deploying.
 
 Common fixes:
-- Install missing dependencies: pip install -r requirements.txt
+- Install the project and its dependencies: pip install -e .
 - Create .env file with proper configuration
-- Initialize database: python init_db.py
+- Initialize database: contacat-init-db (or: python -m app.interface.cli.init_all)
 - Fix failing tests by reviewing error messages
 
 Run this script again after fixes.
@@ -7,20 +7,52 @@ import threading
 import uvicorn
 import sys
 import os
+import time
 
 # Add the project root to the Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from app.interface.api.main import app
 
+# Prefer uvloop (POSIX only) and httptools; fall back to uvicorn defaults if missing
+try:
+    import uvloop  # noqa: F401
+    LOOP = "uvloop"
+except ImportError:
+    LOOP = "asyncio"
+
+try:
+    import httptools  # noqa: F401
+    HTTP = "httptools"
+except ImportError:
+    HTTP = "h11"
+
+APP_URL = "http://127.0.0.1:8000"
+STARTUP_TIMEOUT_SECONDS = 30
+
+server = uvicorn.Server(uvicorn.Config(
+    app,
+    host="127.0.0.1",
+    port=8000,
+    log_level="error",
+    loop=LOOP,
+    http=HTTP,
+    access_log=False
+))
+
 def start_server():
     """Start the FastAPI server in a separate thread."""
-    uvicorn.run(
-        app,
-        host="127.0.0.1",
-        port=8000,
-        log_level="error"
-    )
+    server.run()
+
+def load_when_ready(window, server_thread):
+    """Point the window at the app as soon as uvicorn has finished startup."""
+    deadline = time.monotonic() + STARTUP_TIMEOUT_SECONDS
+    while not server.started:
+        if not server_thread.is_alive() or time.monotonic() > deadline:
+            window.load_html("<h3>No s'ha pogut iniciar el servidor.</h3>")
+            return
+        time.sleep(0.02)
+    window.load_url(APP_URL)
 
 def main():
     """Main entry point for the desktop application."""
@@ -28,14 +60,10 @@ def main():
     server_thread = threading.Thread(target=start_server, daemon=True)
     server_thread.start()
     
-    # Wait a moment for the server to start
-    import time
-    time.sleep(2)
-    
-    # Create and show the window
+    # Create and show the window right away; the URL is loaded once the server is up
     window = webview.create_window(
         'ERP Català',
-        'http://127.0.0.1:8000',
+        html="<h3>Carregant...</h3>",
         width=1400,
         height=900,
         resizable=True,
@@ -43,7 +71,7 @@ def main():
         min_size=(1024, 768)
     )
     
-    webview.start()
+    webview.start(load_when_ready, (window, server_thread))
 
 if __name__ == '__main__':
     main()
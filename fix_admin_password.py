@@ -1,25 +1,35 @@
 #!/usr/bin/env python
-import mysql.connector
-from passlib.context import CryptContext
+import sys
 
-# Create password context
-pwd_context = CryptContext(schemes=["pbkdf2_sha256", "bcrypt"], deprecated="auto")
+import MySQLdb
+
+# Reuse the application's password context so hashes match what login verifies
+from app.domain.auth.services import reset_password_context
+
+# Production bcrypt cost unless --fast-hash is passed explicitly
+pwd_context = reset_password_context(sys.argv[1:])
 
 # Hash the password
 password_hash = pwd_context.hash("admin123")
 
 # Connect to database
-conn = mysql.connector.connect(
+conn = MySQLdb.connect(
     host="localhost",
     user="root",
-    password="root",
-    database="erpdb"
+    passwd="root",
+    db="erpdb",
+    charset="utf8mb4"
 )
 
 cursor = conn.cursor()
 
-# Update admin password
-cursor.execute("UPDATE users SET password_hash = %s WHERE username = 'admin'", (password_hash,))
+# Create or reset the admin user in one statement (no SELECT first, no race)
+cursor.execute(
+    "INSERT INTO users (username, password_hash, role, is_active) "
+    "VALUES ('admin', %s, 'ADMIN', 1) "
+    "ON DUPLICATE KEY UPDATE password_hash = VALUES(password_hash), role = 'ADMIN'",
+    (password_hash,)
+)
 conn.commit()
 
 print(f"Password updated successfully for admin")
@@ -0,0 +1,5 @@
+-- Migration: Index payrolls by period
+-- Date: 2026-10-16
+
+-- Used by the monthly payroll list and the Model 111 quarterly totals
+CREATE INDEX ix_payrolls_year_month ON payrolls (year, month);
@@ -0,0 +1,5 @@
+-- Migration: Index stock movements by item and date
+-- Date: 2026-10-16
+
+-- Used by the per-item movement list and the latest-movement lookup
+CREATE INDEX ix_stock_movements_item_date ON stock_movements (stock_item_code, date);
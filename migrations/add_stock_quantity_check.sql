@@ -0,0 +1,9 @@
+-- Migration: Prevent negative stock at the database level
+-- Date: 2026-10-16
+
+-- Items that already went negative must be corrected before the check can be added
+SELECT code, quantity FROM stock_items WHERE quantity < 0;
+
+-- Enforced by MySQL 8.0.16+
+ALTER TABLE stock_items
+ADD CONSTRAINT ck_stock_items_quantity_non_negative CHECK (quantity >= 0);
@@ -56,12 +56,18 @@ def create_test_data():
         )
     ]
     
-    for acc in accounts:
-        try:
-            account_repo.save(acc)
-            print(f"   [OK] Account {acc.code} created")
-        except Exception as e:
-            print(f"   [SKIP] Account {acc.code} already exists or error: {e}")
+    # One SELECT for the existing codes and one multi-row INSERT for the rest
+    existing_codes = account_repo.list_codes()
+    new_accounts = [acc for acc in accounts if acc.code not in existing_codes]
+    try:
+        account_repo.add_many(new_accounts)
+        for acc in accounts:
+            if acc.code in existing_codes:
+                print(f"   [SKIP] Account {acc.code} already exists")
+            else:
+                print(f"   [OK] Account {acc.code} created")
+    except Exception as e:
+        print(f"   [SKIP] Accounts not created: {e}")
 
     # 2. Create Customer
     print("\n2. Creating Customer...")
@@ -1,6 +1,5 @@
-from passlib.context import CryptContext
-
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Use the application's context so this checks the hashing config login uses
+from app.domain.auth.services import pwd_context
 
 hash = pwd_context.hash("admin123")
 print(f"Hash: {hash}")
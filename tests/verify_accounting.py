@@ -6,13 +6,20 @@ from decimal import Decimal
 # Add project root to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from app.domain.accounts.entities import Account, AccountType
+from app.domain.accounts.entities import Account
 from app.infrastructure.persistence.accounts.repository import SqlAlchemyAccountRepository
 from app.domain.accounts.services import AccountService
 from app.domain.accounting.services import AccountingService
 from app.infrastructure.persistence.accounting.repository import SqlAlchemyJournalRepository
 from app.infrastructure.db.base import Base, engine
 
+# Amounts used by the test entries, parsed once
+_D0 = Decimal("0.00")
+_D10 = Decimal("10.00")
+_D21 = Decimal("21.00")
+_D100 = Decimal("100.00")
+_D121 = Decimal("121.00")
+
 def verify_modules():
     print("1. Initializing Database...")
     Base.metadata.create_all(bind=engine)
@@ -27,25 +34,15 @@ def verify_modules():
     
     print("\n2. Testing Accounts Module...")
     try:
-        # Create accounts
+        # Create accounts (one transaction; existing codes are skipped)
         print("   Creating accounts...")
-        try:
-            account_service.create_account("4300001", "Client A", AccountType.ASSET, 4)
-            print("   - Created Client A (4300001)")
-        except ValueError as e:
-            print(f"   - Client A already exists: {e}")
-
-        try:
-            account_service.create_account("7000001", "Vendes A", AccountType.INCOME, 7)
-            print("   - Created Vendes A (7000001)")
-        except ValueError as e:
-            print(f"   - Vendes A already exists: {e}")
-            
-        try:
-            account_service.create_account("5720001", "Banc Sabadell", AccountType.ASSET, 5)
-            print("   - Created Banc Sabadell (5720001)")
-        except ValueError as e:
-            print(f"   - Banc Sabadell already exists: {e}")
+        created = account_service.import_accounts([
+            {"code": "4300001", "name": "Client A", "type": "ASSET", "group": 4},
+            {"code": "7000001", "name": "Vendes A", "type": "INCOME", "group": 7},
+            {"code": "5720001", "name": "Banc Sabadell", "type": "ASSET", "group": 5},
+            {"code": "4770001", "name": "HP IVA Repercutit", "type": "LIABILITY", "group": 4},
+        ])
+        print(f"   - Created {created} new accounts")
 
         # List accounts
         accounts = account_service.list_accounts()
@@ -63,33 +60,16 @@ def verify_modules():
             entry_date=date.today(),
             description="Factura Venda Client A",
             lines=[
-                ("4300001", Decimal("121.00"), Decimal("0.00"), "Factura F-001"),
-                ("7000001", Decimal("0.00"), Decimal("100.00"), "Base Imposable"),
-                # Assuming 477 exists or skipping for simplicity, let's just balance it with 2 lines for now or add 477
-            ]
-        )
-        # Wait, I need to balance it. 121 vs 100. Need 21 VAT.
-        # Let's create VAT account first
-        try:
-            account_service.create_account("4770001", "HP IVA Repercutit", AccountType.LIABILITY, 4)
-        except:
-            pass
-            
-        # Retry with VAT
-        entry = accounting_service.create_journal_entry(
-            entry_date=date.today(),
-            description="Factura Venda Client A",
-            lines=[
-                ("4300001", Decimal("121.00"), Decimal("0.00"), "Factura F-001"),
-                ("7000001", Decimal("0.00"), Decimal("100.00"), "Base Imposable"),
-                ("4770001", Decimal("0.00"), Decimal("21.00"), "IVA 21%"),
+                ("4300001", _D121, _D0, "Factura F-001"),
+                ("7000001", _D0, _D100, "Base Imposable"),
+                ("4770001", _D0, _D21, "IVA 21%"),
             ]
         )
         print(f"   - Created Entry #{entry.entry_number} (Status: {entry.status.value})")
         
         # Post entry
         print("   Posting Entry...")
-        accounting_service.post_journal_entry(entry.id)
+        entry = accounting_service.post_journal_entry(entry.id)
         print(f"   - Entry Posted (Status: {entry.status.value})")
         
         # Check Ledger
@@ -102,6 +82,23 @@ def verify_modules():
         tb = accounting_service.get_trial_balance()
         print(f"   - Trial Balance items: {len(tb)}")
         
+        # Batch creation
+        print("   Creating batch of entries...")
+        entries = accounting_service.create_journal_entries([
+            {
+                "entry_date": date.today(),
+                "description": f"Cobrament Client A #{i}",
+                "lines": [
+                    ("5720001", _D10, _D0, "Cobrament"),
+                    ("4300001", _D0, _D10, "Cobrament"),
+                ]
+            }
+            for i in range(1, 4)
+        ])
+        numbers = [e.entry_number for e in entries]
+        assert numbers == list(range(numbers[0], numbers[0] + 3)), numbers
+        print(f"   - Created Entries #{numbers[0]}-#{numbers[-1]}")
+        
     except Exception as e:
         print(f"   ERROR in Accounting Module: {e}")
         import traceback
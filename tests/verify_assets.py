@@ -8,7 +8,11 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 from app.infrastructure.db.base import SessionLocal, init_db
 from app.domain.assets.entities import Asset, AssetStatus, DepreciationMethod
 from app.infrastructure.persistence.assets.repositories import SqlAlchemyAssetRepository
+from app.infrastructure.persistence.accounts.repository import SqlAlchemyAccountRepository
+from app.infrastructure.persistence.accounting.repository import SqlAlchemyJournalRepository
 from app.domain.assets.services import AssetService
+from app.domain.accounts.services import AccountService
+from app.domain.accounting.services import AccountingService
 
 def verify_assets():
     print("Initializing database...")
@@ -17,7 +21,16 @@ def verify_assets():
     
     try:
         repo = SqlAlchemyAssetRepository(db)
-        service = AssetService(repo)
+        account_repo = SqlAlchemyAccountRepository()
+        accounting_service = AccountingService(account_repo, SqlAlchemyJournalRepository())
+        service = AssetService(repo, accounting_service)
+        
+        # Accounts used by the asset's journal entries
+        AccountService(account_repo).import_accounts([
+            {"code": "217000", "name": "Equips informàtics", "type": "ASSET", "group": 2},
+            {"code": "281700", "name": "Amort. Acum. Equips informàtics", "type": "ASSET", "group": 2},
+            {"code": "681700", "name": "Amort. Immobilitzat Material", "type": "EXPENSE", "group": 6},
+        ])
         
         # 1. Create Asset
         print("\n1. Creating Test Asset...")
@@ -56,12 +69,12 @@ def verify_assets():
             print("ERROR: Depreciation calculation incorrect!")
             return
 
-        # 3. Generate Depreciation Entry
-        print("\n3. Generating Depreciation Entry for 2024...")
+        # 3. Generate Depreciation Entries for the whole useful life (one batch)
+        print("\n3. Generating Depreciation Entries for 2024-2027...")
         try:
-            entry = service.generate_depreciation_entries(asset.id, 2024)
-            print(f"Entry generated: {entry.amount}€ on {entry.date}")
-            print(f"Accumulated Depreciation: {entry.accumulated_depreciation}€")
+            entries = service.generate_all_depreciation_entries(asset.id)
+            for entry in entries:
+                print(f"Entry generated: {entry.amount}€ on {entry.date} (Accumulated: {entry.accumulated_depreciation}€)")
         except ValueError as e:
             print(f"Depreciation generation failed (might be already done): {e}")
 
@@ -71,10 +84,10 @@ def verify_assets():
         print(f"Asset Current Value: {refreshed_asset.current_value}€")
         print(f"Asset Status: {refreshed_asset.status}")
         
-        if len(refreshed_asset.depreciation_entries) > 0:
-            print("SUCCESS: Depreciation entries found.")
+        if len(refreshed_asset.depreciation_entries) == 4 and refreshed_asset.status == AssetStatus.FULLY_DEPRECIATED:
+            print("SUCCESS: Full depreciation schedule found.")
         else:
-            print("ERROR: No depreciation entries found.")
+            print(f"ERROR: Expected 4 depreciation entries, found {len(refreshed_asset.depreciation_entries)}.")
 
     except Exception as e:
         print(f"\nERROR: {e}")
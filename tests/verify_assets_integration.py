@@ -14,6 +14,10 @@ from app.infrastructure.persistence.accounts.repository import SqlAlchemyAccount
 from app.infrastructure.persistence.accounting.repository import SqlAlchemyJournalRepository
 from app.domain.assets.services import AssetService
 from app.domain.accounting.services import AccountingService
+from app.domain.accounts.services import AccountService
+
+# Expected 2024 depreciation: 10000 over 10 years, no residual value
+_D1000 = Decimal("1000.0")
 
 def verify_integration():
     print("Initializing database...")
@@ -38,12 +42,12 @@ def verify_integration():
             ("681000", "Amort. Immobilitzat Material", AccountType.EXPENSE, 6)
         ]
         
-        for code, name, type_, group in accounts_to_create:
-            if not account_repo.find_by_code(code):
-                accounting_service.create_account(code, name, type_, group)
-                print(f"Created account {code}")
-            else:
-                print(f"Account {code} already exists")
+        # One lookup of the existing codes and one batch insert for the missing ones
+        created = AccountService(account_repo).import_accounts(
+            {"code": code, "name": name, "type": type_, "group": group}
+            for code, name, type_, group in accounts_to_create
+        )
+        print(f"Created {created} accounts ({len(accounts_to_create) - created} already existed)")
                 
         print("Creating test asset...")
         asset_code = "TEST-ASSET-001"
@@ -71,9 +75,9 @@ def verify_integration():
             
         print("Generating depreciation for 2024...")
         # Check if already depreciated for 2024
-        already_depreciated = any(entry.date.year == 2024 for entry in asset.depreciation_entries)
+        entry_2024 = next((entry for entry in asset.depreciation_entries if entry.date.year == 2024), None)
         
-        if not already_depreciated:
+        if entry_2024 is None:
             depreciation_entry = asset_service.generate_depreciation_entries(asset.id, 2024)
             print(f"Generated depreciation entry: {depreciation_entry.amount} EUR")
             
@@ -88,23 +92,27 @@ def verify_integration():
                 print(f"Description: {journal_entry.description}")
                 print(f"Date: {journal_entry.entry_date}")
                 print("Lines:")
-                for line in journal_entry.lines:
-                    print(f" - {line.account_code}: Debit={line.debit}, Credit={line.credit}")
+                print("\n".join(
+                    f" - {line.account_code}: Debit={line.debit}, Credit={line.credit}"
+                    for line in journal_entry.lines
+                ))
                 
                 # Assertions
-                assert journal_entry.total_debit == Decimal("1000.0"), f"Expected total debit 1000.0, got {journal_entry.total_debit}"
-                assert journal_entry.total_credit == Decimal("1000.0"), f"Expected total credit 1000.0, got {journal_entry.total_credit}"
-                assert any(l.account_code == "681000" and l.debit == Decimal("1000.0") for l in journal_entry.lines), "Debit line missing or incorrect"
-                assert any(l.account_code == "281000" and l.credit == Decimal("1000.0") for l in journal_entry.lines), "Credit line missing or incorrect"
+                assert journal_entry.total_debit == _D1000, f"Expected total debit 1000.0, got {journal_entry.total_debit}"
+                assert journal_entry.total_credit == _D1000, f"Expected total credit 1000.0, got {journal_entry.total_credit}"
+                debit_ok = credit_ok = False
+                for l in journal_entry.lines:
+                    debit_ok = debit_ok or (l.account_code == "681000" and l.debit == _D1000)
+                    credit_ok = credit_ok or (l.account_code == "281000" and l.credit == _D1000)
+                assert debit_ok, "Debit line missing or incorrect"
+                assert credit_ok, "Credit line missing or incorrect"
                 
                 print("VERIFICATION SUCCESSFUL: Journal Entry created correctly.")
             else:
                 print("VERIFICATION FAILED: Journal Entry not found.")
         else:
             print("Asset already depreciated for 2024. Skipping generation.")
-            # Retrieve the entry to verify
-            depreciation_entry = next(entry for entry in asset.depreciation_entries if entry.date.year == 2024)
-            journal_entry = journal_repo.find_by_number(depreciation_entry.journal_entry_id)
+            journal_entry = journal_repo.find_by_number(entry_2024.journal_entry_id)
             if journal_entry:
                  print("VERIFICATION SUCCESSFUL: Existing Journal Entry found.")
             else:
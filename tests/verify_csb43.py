@@ -1,5 +1,6 @@
 import sys
 import os
+import time
 
 # Ensure app modules are importable
 sys.path.insert(0, os.getcwd())
@@ -13,22 +14,22 @@ def create_sample_n43():
     # 33: Footer
     
     # 11: Bank 0049, Office 1234, Account 1234567890, Dates 250101-250131, Start Bal +1000.00 EUR
-    line_11 = "11004912341234567890250101250131200000001000009782Sample Account             "
+    line_11 = b"11004912341234567890250101250131200000001000009782Sample Account             "
     
     # 22: Date 250102, Value 250102, Concept 01, Own 000, Debit (1), 50.00, Doc 123 (10 chars), Ref "Payment Invoice"
     # Amount: 00000000005000 (14 chars) -> 50.00
     # Doc: 0000000123 (10 chars)
-    line_22_1 = "2200491234250102250102010001000000000050000000000123Payment Invoice 001                      "
+    line_22_1 = b"2200491234250102250102010001000000000050000000000123Payment Invoice 001                      "
     
     # 22: Date 250105, Value 250105, Concept 02, Own 000, Credit (2), 200.00, Doc 124 (10 chars), Ref "Client Transfer"
     # Amount: 00000000020000 (14 chars) -> 200.00
-    line_22_2 = "2200491234250105250105020002000000000200000000000124Client Transfer ABC                      "
+    line_22_2 = b"2200491234250105250105020002000000000200000000000124Client Transfer ABC                      "
     
     # 33: Summary (Start + Credits - Debits) = 1000 - 50 + 200 = 1150.00
-    line_33 = "330049123412345678900001000000000500000001000000002000020000000115000978"
+    line_33 = b"330049123412345678900001000000000500000001000000002000020000000115000978"
     
-    content = f"{line_11}\n{line_22_1}\n{line_22_2}\n{line_33}"
-    return content.encode('latin-1')
+    # All records are ASCII, so build the file as bytes directly
+    return b"\n".join([line_11, line_22_1, line_22_2, line_33])
 
 def verify_parser():
     print("[INFO] Creating Sample CSB43 file...")
@@ -71,5 +72,27 @@ def verify_parser():
 
     print("\n[VERIFIED] CSB43 Parser works correctly!")
 
+def verify_large_file(repeats=5000):
+    # Same sample with its two transactions repeated: 10k '22' records
+    header, txn_1, txn_2, footer = create_sample_n43().split(b"\n")
+    content = b"\n".join([header] + [txn_1, txn_2] * repeats + [footer])
+    
+    print(f"\n[INFO] Parsing synthetic file with {2 * repeats} transactions...")
+    start = time.perf_counter()
+    statements = CSB43Parser().parse("large.n43", content)
+    elapsed = time.perf_counter() - start
+    
+    lines = statements[0].lines
+    if len(lines) != 2 * repeats:
+        print(f"[FAILURE] Expected {2 * repeats} lines, got {len(lines)}")
+        return
+    total = sum(line.amount for line in lines)
+    if round(total, 2) != 150.00 * repeats:
+        print(f"[FAILURE] Total mismatch: {total} != {150.00 * repeats}")
+        return
+    
+    print(f"[VERIFIED] Large file parsed in {elapsed * 1000:.0f} ms")
+
 if __name__ == "__main__":
     verify_parser()
+    verify_large_file()
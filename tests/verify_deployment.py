@@ -7,24 +7,26 @@ BASE_URL = "http://localhost:8001"
 USERNAME = "Ignasi"
 PASSWORD = "Vinyet_2024"
 
+# Rutes canòniques (amb la barra final) perquè cap petició depengui d'una redirecció
 ROUTES_TO_CHECK = [
     "/",
-    "/partners",
-    "/employees",
-    "/accounting",
-    "/inventory",
-    "/quotes",
-    "/sales/orders",
-    "/assets",
-    "/accounts",
-    "/analytics",
-    "/fiscal"
+    "/partners/",
+    "/hr/employees",
+    "/accounting/journal",
+    "/inventory/",
+    "/quotes/",
+    "/sales/orders/",
+    "/assets/",
+    "/accounts/",
+    "/analytics/",
+    "/fiscal/"
 ]
 
 async def verify():
     print(f"[*] Verificant desplegament a {BASE_URL}...")
     
-    async with httpx.AsyncClient(base_url=BASE_URL, follow_redirects=True) as client:
+    limits = httpx.Limits(max_connections=len(ROUTES_TO_CHECK), max_keepalive_connections=len(ROUTES_TO_CHECK))
+    async with httpx.AsyncClient(base_url=BASE_URL, follow_redirects=False, limits=limits) as client:
         # 1. Login
         print("[*] Intentant fer login...")
         try:
@@ -51,24 +53,34 @@ async def verify():
         all_passed = True
         print("\n[*] Verificant mòduls...")
         
-        for route in ROUTES_TO_CHECK:
-            try:
-                headers = {"Authorization": f"Bearer {access_token}"}
-                resp = await client.get(route, headers=headers)
-                
-                if resp.status_code == 200:
-                    print(f"  [OK] {route:<20} -> 200 OK")
-                elif resp.status_code == 404:
-                    print(f"  [WARN] {route:<20} -> 404 NOT FOUND")
-                    all_passed = False
-                elif resp.status_code == 500:
-                    print(f"  [FAIL] {route:<20} -> 500 INTERNAL SERVER ERROR")
-                    all_passed = False
+        # Totes les peticions alhora sobre el mateix pool de connexions
+        headers = {"Authorization": f"Bearer {access_token}"}
+        results = await asyncio.gather(
+            *(client.get(route, headers=headers) for route in ROUTES_TO_CHECK),
+            return_exceptions=True
+        )
+        
+        for route, resp in zip(ROUTES_TO_CHECK, results):
+            if isinstance(resp, Exception):
+                print(f"  [FAIL] {route:<20} -> Error de connexió: {resp}")
+                all_passed = False
+            elif resp.status_code == 200:
+                print(f"  [OK] {route:<20} -> 200 OK")
+            elif resp.is_redirect:
+                location = resp.headers.get("location", "")
+                if "/auth/login" in location:
+                    print(f"  [FAIL] {route:<20} -> {resp.status_code} redirigit al login (sessió no vàlida)")
                 else:
-                    print(f"  [?] {route:<20} -> {resp.status_code}")
-            except Exception as e:
-                print(f"  [FAIL] {route:<20} -> Error de connexió: {e}")
+                    print(f"  [WARN] {route:<20} -> {resp.status_code} redirigit a {location}")
+                all_passed = False
+            elif resp.status_code == 404:
+                print(f"  [WARN] {route:<20} -> 404 NOT FOUND")
+                all_passed = False
+            elif resp.status_code == 500:
+                print(f"  [FAIL] {route:<20} -> 500 INTERNAL SERVER ERROR")
                 all_passed = False
+            else:
+                print(f"  [?] {route:<20} -> {resp.status_code}")
                 
         print("\n" + "="*30)
         if all_passed:
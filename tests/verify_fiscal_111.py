@@ -52,29 +52,28 @@ def verify_model_111():
         
         print(f"   Payroll Generated: Gross {pay_oct.gross_salary}, IRPF {pay_oct.irpf_amount}, Status {pay_oct.status}")
         
-        # 2a. Ensure Accounts exist
-        from app.domain.accounts.entities import Account, AccountType
+        # 2a. Ensure Accounts exist (one SELECT of existing codes, one INSERT for the rest)
+        from app.domain.accounts.services import AccountService
         from app.infrastructure.persistence.accounts.repository import SqlAlchemyAccountRepository
-        acc_repo = SqlAlchemyAccountRepository(SessionLocal)
+        acc_service = AccountService(SqlAlchemyAccountRepository(SessionLocal))
         
-        for code, name in [("62300000", "Serveis Professionals"), ("47510000", "HP Creditora IRPF"), ("41000000", "Creditors")]:
-             if not acc_repo.find_by_code(code):
-                 acc_repo.add(Account(
-                     code=code, 
-                     name=name, 
-                     account_type=AccountType.LIABILITY if code.startswith("4") else AccountType.EXPENSE,
-                     # description="Test Account", # Removed
-                     group=code[0], # Added group
-                     parent_code=code[:3]
-                 ))
+        acc_service.import_accounts([
+            {
+                "code": code,
+                "name": name,
+                "type": "LIABILITY" if code.startswith("4") else "EXPENSE",
+                "group": code[0],
+                "parent_code": code[:3]
+            }
+            for code, name in [("62300000", "Serveis Professionals"), ("47510000", "HP Creditora IRPF"), ("41000000", "Creditors")]
+        ])
 
         # 2b. Creating Professional Invoice Journal Entry...
         # Credit 4751 (Liability) = 150 (We owe 150 to Hacienda)
         # Debit 623 (Professional Services) = 1000
         # Credit 410 (Creditor) = 850
-        import random
         entry = JournalEntry(
-            entry_number=random.randint(100000, 999999), # Avoid duplicate
+            entry_number=journal_repo.get_next_entry_number(), # MAX + 1, never collides on re-runs
             entry_date=date(2025, 11, 15),
             description="Factura Notari (Retencion 15%)",
             status=JournalEntryStatus.POSTED,
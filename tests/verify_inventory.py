@@ -84,13 +84,11 @@ def run_verification():
 
     # Get a legitimate partner (assuming ID 1 exists from previous tests or verify_sales)
     # If not, let's create a dummy or fetch first
-    partners = partner_repo.list_all()
-    if not partners:
+    partner_id = partner_repo.find_first_id()
+    if partner_id is None:
         print("[ERROR] No partners found. Run verify_sales.py setup first if needed.")
         return
     
-    partner_id = partners[0].id
-    
     invoice = sales_service.create_invoice(
         partner_id=partner_id,
         invoice_date=date.today(),
@@ -115,8 +113,7 @@ def run_verification():
         print(f"[FAILURE] Stock esperat 95, trobat {updated_item.quantity}.")
 
     # 7b. Check Movement Log
-    movements = inventory_service.list_movements(stock_code)
-    last_move = movements[0] if movements else None
+    last_move = inventory_service.get_last_movement(stock_code)
     
     if last_move and last_move.quantity == -5:
          print(f"[SUCCESS] Moviment registrat correctament ({last_move.quantity}).")
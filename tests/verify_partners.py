@@ -22,23 +22,20 @@ def verify_partners():
     print("\n1. Inicialitzant base de dades...")
     init_db()
     
-    session = SessionLocal()
-    
     try:
-        # Repositories & Services
-        repo = SqlAlchemyPartnerRepository(session)
+        # Repositories & Services (the repository opens and commits its own sessions)
+        repo = SqlAlchemyPartnerRepository(SessionLocal)
         service = PartnerService(repo)
         
         # 1. Create Partner
         print("\n[Step 1] Creant partner de prova...")
-        tax_id = "B12345678"
+        tax_id = "B12345674"
         
         # Cleanup
         existing = repo.find_by_tax_id(tax_id)
         if existing:
             print(f"   - Esborrant partner existent {tax_id}...")
             repo.delete(existing.id)
-            session.commit()
             
         partner = service.create_partner(
             name="Empresa de Prova S.L.",
@@ -53,7 +50,7 @@ def verify_partners():
             postal_code="08018",
             province="Barcelona",
             vat_regime="GENERAL",
-            iban="ES9100000000000000000000"
+            iban="ES9121000418450200051332"
         )
         
         print(f"✓ Partner creat: {partner.name} ({partner.tax_id})")
@@ -110,8 +107,6 @@ def verify_partners():
         import traceback
         traceback.print_exc()
         return False
-    finally:
-        session.close()
 
 if __name__ == "__main__":
     success = verify_partners()
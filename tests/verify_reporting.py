@@ -1,58 +1,72 @@
-import requests
-import time
-import sys
+import asyncio
+import httpx
 
 BASE_URL = "http://127.0.0.1:8002"
 
-def verify_reports():
-    print("--- Verifying Financial Reports (Live Server) ---")
-    
-    # Wait for server
-    for i in range(10):
+# (title, url, expects PDF)
+REPORTS = [
+    ("1. Testing Balance Sheet (HTML)...", "/accounting/reports/balance-sheet", False),
+    ("2. Testing Profit & Loss (HTML)...", "/accounting/reports/profit-loss", False),
+    ("3. Testing Balance Sheet (PDF Export)...", "/accounting/reports/balance-sheet/export?format=pdf", True),
+    ("4. Testing Profit & Loss (PDF Export)...", "/accounting/reports/profit-loss/export?format=pdf", True),
+]
+
+# Poll quickly first, then back off: about 10 s in total, as before
+WARMUP_DELAYS = (0.05, 0.1, 0.2, 0.5, 1, 2, 2, 2, 2)
+
+async def wait_for_server(client: httpx.AsyncClient):
+    for i, delay in enumerate(WARMUP_DELAYS):
         try:
-            requests.get(f"{BASE_URL}/", timeout=1)
-            break
-        except:
+            await client.get("/", timeout=1)
+            return
+        except httpx.TransportError:
             print(f"Waiting for server... {i}")
-            time.sleep(1)
-            
-    try:
-        # 1. Balance Sheet HTML
-        print("\n1. Testing Balance Sheet (HTML)...")
-        response = requests.get(f"{BASE_URL}/accounting/reports/balance-sheet")
-        if response.status_code == 200:
-            print("[OK] HTML OK")
-        else:
-            print(f"[FAIL] Failed: {response.status_code}")
-            
-        # 2. Profit & Loss HTML
-        print("\n2. Testing Profit & Loss (HTML)...")
-        response = requests.get(f"{BASE_URL}/accounting/reports/profit-loss")
-        if response.status_code == 200:
-            print("[OK] HTML OK")
-        else:
-            print(f"[FAIL] Failed: {response.status_code}")
-            
-        # 3. Balance Sheet PDF
-        print("\n3. Testing Balance Sheet (PDF Export)...")
-        response = requests.get(f"{BASE_URL}/accounting/reports/balance-sheet/export?format=pdf")
-        if response.status_code == 200 and response.headers["content-type"] == "application/pdf":
-            print(f"[OK] PDF OK ({len(response.content)} bytes)")
-        else:
-            print(f"[FAIL] Failed: Status={response.status_code}, Type={response.headers.get('content-type')}")
-            if response.status_code != 200:
-                print(response.content[:200])
-
-        # 4. Profit & Loss PDF
-        print("\n4. Testing Profit & Loss (PDF Export)...")
-        response = requests.get(f"{BASE_URL}/accounting/reports/profit-loss/export?format=pdf")
-        if response.status_code == 200 and response.headers["content-type"] == "application/pdf":
-             print(f"[OK] PDF OK ({len(response.content)} bytes)")
+            await asyncio.sleep(delay)
+
+async def fetch(client: httpx.AsyncClient, url: str):
+    """Stream a report and count its bytes without holding the whole body in memory.
+
+    Returns (status, content type, size, first bytes of the body).
+    """
+    async with client.stream("GET", url) as response:
+        size = 0
+        head = b""
+        async for chunk in response.aiter_bytes(65536):
+            if not head:
+                head = chunk[:200]
+            size += len(chunk)
+        return response.status_code, response.headers.get("content-type"), size, head
+
+async def verify_reports():
+    print("--- Verifying Financial Reports (Live Server) ---")
+
+    async with httpx.AsyncClient(base_url=BASE_URL, timeout=30) as client:
+        await wait_for_server(client)
+
+        # The reports are independent: request them all at once, so the total
+        # wait is the slowest PDF export rather than the sum of all four
+        results = await asyncio.gather(
+            *(fetch(client, url) for _, url, _ in REPORTS),
+            return_exceptions=True
+        )
+
+    for (title, url, is_pdf), result in zip(REPORTS, results):
+        print(f"\n{title}")
+        if isinstance(result, Exception):
+            print(f"[FAIL] Connection Error: {result}")
+            continue
+        status, content_type, size, head = result
+        if not is_pdf:
+            if status == 200:
+                print("[OK] HTML OK")
+            else:
+                print(f"[FAIL] Failed: {status}")
+        elif status == 200 and content_type == "application/pdf":
+            print(f"[OK] PDF OK ({size} bytes)")
         else:
-            print(f"[FAIL] Failed: Status={response.status_code}, Type={response.headers.get('content-type')}")
-            
-    except requests.RequestException as e:
-        print(f"[FAIL] Connection Error: {e}")
+            print(f"[FAIL] Failed: Status={status}, Type={content_type}")
+            if status != 200:
+                print(head)
 
 if __name__ == "__main__":
-    verify_reports()
+    asyncio.run(verify_reports())
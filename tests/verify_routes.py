@@ -0,0 +1,41 @@
+"""
+Script de verificació del registre de rutes de l'API.
+Comprova que cap ruta (mètode + path) es registra dues vegades a l'aplicació.
+"""
+import sys
+import os
+from collections import Counter
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from fastapi.routing import APIRoute
+
+from app.interface.api.main import app
+
+def verify_routes():
+    print("=" * 60)
+    print("VERIFICACIÓ DE RUTES DE L'API")
+    print("=" * 60)
+
+    routes = Counter(
+        (method, route.path)
+        for route in app.routes
+        if isinstance(route, APIRoute)
+        for method in route.methods
+    )
+    print(f"\n1. Rutes registrades: {len(routes)}")
+
+    duplicates = [(method, path, count) for (method, path), count in routes.items() if count > 1]
+    if duplicates:
+        for method, path, count in duplicates:
+            print(f"  ✗ {method} {path} registrada {count} vegades")
+        return False
+
+    print("  ✓ Cap ruta duplicada")
+    print("\n✅ Verificació de rutes completada correctament!")
+    return True
+
+if __name__ == "__main__":
+    success = verify_routes()
+    sys.exit(0 if success else 1)
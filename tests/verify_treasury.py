@@ -24,12 +24,10 @@ def verify_treasury():
     print("\n1. Inicialitzant base de dades...")
     init_db()
     
-    session = SessionLocal()
-    
     try:
-        # Repositories & Services
-        treasury_repo = SqlAlchemyTreasuryRepository(session)
-        invoice_repo = SqlAlchemySalesInvoiceRepository(session) # To mock/check forecast
+        # Repositories & Services (each repository opens its own sessions)
+        treasury_repo = SqlAlchemyTreasuryRepository(SessionLocal)
+        invoice_repo = SqlAlchemySalesInvoiceRepository(SessionLocal) # To mock/check forecast
         
         # Inject invoice repo into treasury service for forecast
         service = TreasuryService(treasury_repo, invoice_repo)
@@ -38,13 +36,9 @@ def verify_treasury():
         print("\n[Step 1] Creant compte bancari...")
         iban_test = "ES9121000000000000001234"
         
-        # Cleanup
-        accounts = service.list_bank_accounts()
-        for acc in accounts:
-            if acc.iban == iban_test:
-                print(f"   - Compte existent trobat, utilitzant-lo.")
-        
-        if not any(acc.iban == iban_test for acc in accounts):
+        if service.bank_account_exists(iban_test):
+            print(f"   - Compte existent trobat, utilitzant-lo.")
+        else:
             account = service.create_bank_account(
                 name="Compte Principal prova",
                 iban=iban_test,
@@ -57,25 +51,30 @@ def verify_treasury():
         print("\n[Step 2] Verificant previsió de tresoreria (Cash Flow)...")
         # We need to ensure there is at least one POSTED invoice.
         # Check existing invoices
-        invoices = invoice_repo.list_all()
-        posted_invoices = [i for i in invoices if i.status == InvoiceStatus.POSTED]
+        posted_count = invoice_repo.count_by_status(InvoiceStatus.POSTED)
         
-        if not posted_invoices:
+        if not posted_count:
             print("   - No hi ha factures comptabilitzades. El forecast d'entrades serà 0.")
         else:
-            print(f"   - Trobades {len(posted_invoices)} factures pendents de cobrament.")
+            print(f"   - Trobades {posted_count} factures pendents de cobrament.")
             
         forecast = service.get_cash_flow_forecast(days=60)
         
         print(f"✓ Previsió generada per a {forecast['forecast_days']} dies")
-        print(f"   - Total Entrades (Inflow): {forecast['total_inflow']} €")
-        print(f"   - Total Sortides (Outflow): {forecast['total_outflow']} €")
-        print(f"   - Flux Net: {forecast['net_flow']} €")
+        # Same 60-day window for both: receivables holds only invoices due within it
+        inflow = sum(item['amount'] for item in forecast['receivables'])
+        outflow = forecast['recurring_expenses']['total_monthly'] * 2
+        print(f"   - Total Entrades (Inflow): {inflow} €")
+        print(f"   - Total Sortides (Outflow): {outflow} €")
+        print(f"   - Flux Net: {inflow - outflow} €")
+        print(f"   - Tresoreria prevista a 60 dies: {forecast['projections']['day_60']} €")
         
-        if forecast['inflow']:
+        if forecast['receivables']:
             print("   - Detall Entrades:")
-            for item in forecast['inflow'][:5]: # Show max 5
-                print(f"     > {item['date']} | {item['amount']}€ | {item['description']}")
+            print("\n".join(  # Show max 5
+                f"     > {item['due_date']} | {item['amount']}€ | Factura {item['invoice_number']}"
+                for item in forecast['receivables'][:5]
+            ))
         
         print("\n✅ Verificació de Tresoreria completada correctament!")
         return True
@@ -85,8 +84,6 @@ def verify_treasury():
         import traceback
         traceback.print_exc()
         return False
-    finally:
-        session.close()
 
 if __name__ == "__main__":
     success = verify_treasury()